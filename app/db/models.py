@@ -1398,6 +1398,8 @@ def merge_pull_request(session: Session, pull_request: PullRequest, relationship
     
     Uses ON CREATE SET for immutable properties (number, created_at)
     and SET for mutable properties (title, state, updated_at, merged_at, closed_at, etc.).
+    Also derives merge_days (whole days from created_at to merged_at) so merge-time
+    analytics can aggregate a stored number instead of computing durations per query.
     
     Args:
         session: Neo4j session
@@ -1417,6 +1419,7 @@ def merge_pull_request(session: Session, pull_request: PullRequest, relationship
         pr.updated_at = datetime($updated_at),
         pr.merged_at = CASE WHEN $merged_at IS NOT NULL THEN datetime($merged_at) ELSE null END,
         pr.closed_at = CASE WHEN $closed_at IS NOT NULL THEN datetime($closed_at) ELSE null END,
+        pr.merge_days = CASE WHEN $merged_at IS NOT NULL THEN duration.between(pr.created_at, datetime($merged_at)).days ELSE null END,
         pr.commits_count = $commits_count,
         pr.additions = $additions,
         pr.deletions = $deletions,
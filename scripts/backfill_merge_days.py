@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Backfill PullRequest.merge_days on graphs loaded before merge_pull_request()
+started deriving it at ingestion time.
+Safe to re-run: only merged PRs without merge_days are updated.
+"""
+
+import os
+import sys
+from neo4j import GraphDatabase
+
+NEO4J_URI = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
+NEO4J_USER = os.getenv('NEO4J_USERNAME', 'neo4j')
+NEO4J_PASSWORD = os.getenv('NEO4J_PASSWORD', 'password123')
+
+# Same formula as merge_pull_request() in app/db/models.py
+BACKFILL_QUERY = """
+MATCH (pr:PullRequest)
+WHERE pr.merged_at IS NOT NULL AND pr.merge_days IS NULL
+CALL {
+    WITH pr
+    SET pr.merge_days = duration.between(pr.created_at, pr.merged_at).days
+} IN TRANSACTIONS OF 10000 ROWS
+RETURN count(pr) as updated
+"""
+
+
+def backfill_merge_days():
+    """Set merge_days on every merged PR that is missing it."""
+    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    
+    try:
+        with driver.session() as session:
+            # CALL { ... } IN TRANSACTIONS needs an implicit (auto-commit) transaction
+            updated = session.run(BACKFILL_QUERY).single()['updated']
+            print(f"✓ Pull requests updated: {updated}")
+    finally:
+        driver.close()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("Backfilling PullRequest.merge_days")
+    print("=" * 70)
+    print(f"\nConnecting to: {NEO4J_URI}")
+    print(f"User: {NEO4J_USER}\n")
+    
+    try:
+        backfill_merge_days()
+        print("\n✅ Backfill complete!")
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Backfill interrupted by user.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {str(e)}")
+        sys.exit(1)
@@ -76,6 +76,7 @@ def create_indexes():
         "CREATE INDEX pr_merged_at IF NOT EXISTS FOR (pr:PullRequest) ON (pr.merged_at)",
         "CREATE INDEX pr_updated_at IF NOT EXISTS FOR (pr:PullRequest) ON (pr.updated_at)",
         "CREATE INDEX pr_closed_at IF NOT EXISTS FOR (pr:PullRequest) ON (pr.closed_at)",
+        "CREATE INDEX pr_merge_days IF NOT EXISTS FOR (pr:PullRequest) ON (pr.merge_days)",
     ]
     
     # Priority 4: Composite Indexes
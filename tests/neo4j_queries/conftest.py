@@ -66,18 +66,40 @@ def neo4j_driver():
     driver.close()
 
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "fetch_size(n): number of records the driver pulls per Bolt batch for this test"
+    )
+
+
 @pytest.fixture(scope="function")
-def neo4j_session(neo4j_driver):
-    """Create a new Neo4j session for each test."""
-    session = neo4j_driver.session()
+def neo4j_session(neo4j_driver, request):
+    """
+    Create a new Neo4j session for each test.
+    The driver fetch size comes from the test's fetch_size marker, falling
+    back to NEO4J_FETCH_SIZE and then to the driver default.
+    """
+    marker = request.node.get_closest_marker("fetch_size")
+    fetch_size = marker.args[0] if marker else os.getenv('NEO4J_FETCH_SIZE')
+    
+    session_kwargs = {"fetch_size": int(fetch_size)} if fetch_size else {}
+    session = neo4j_driver.session(**session_kwargs)
     yield session
     session.close()
 
 
+@pytest.fixture(scope="session")
+def warmed_queries():
+    """Query texts whose plans are already cached, shared by every test."""
+    return set()
+
+
 @pytest.fixture(scope="function")
-def query_executor(neo4j_session):
+def query_executor(neo4j_session, warmed_queries):
     """Create query executor for each test."""
-    return QueryExecutor(neo4j_session)
+    return QueryExecutor(neo4j_session, warmed_queries)
 
 
 @pytest.fixture(scope="function")
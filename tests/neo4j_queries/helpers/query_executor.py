@@ -3,7 +3,7 @@ Query executor with metrics collection.
 """
 
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
 from neo4j import Session
 from neo4j.time import DateTime, Date, Time, Duration
 
@@ -13,16 +13,25 @@ from .models import QueryResult, QueryExpectation
 class QueryExecutor:
     """Executes Neo4j queries and captures metrics."""
     
-    def __init__(self, session: Session):
-        """Initialize with Neo4j session."""
+    def __init__(self, session: Session, warmed_queries: Optional[Set[str]] = None):
+        """
+        Initialize with Neo4j session.
+        
+        Args:
+            session: Neo4j session
+            warmed_queries: Query texts already planned; share one set across
+                            executors so each query is EXPLAINed once per run
+        """
         self.session = session
+        self.warmed_queries = warmed_queries if warmed_queries is not None else set()
     
     def execute(
         self,
         query_name: str,
         section: str,
         query_text: str,
-        expectation: QueryExpectation = None
+        expectation: QueryExpectation = None,
+        row_mapper: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> QueryResult:
         """
         Execute a query and capture all metrics.
@@ -32,6 +41,8 @@ class QueryExecutor:
             section: Section/category (e.g., "People & Identity")
             query_text: Cypher query to execute
             expectation: Optional expectations for validation
+            row_mapper: Optional client-side transform applied to each result row
+                        (e.g., mapping a numeric bucket returned by the server to a label)
             
         Returns:
             QueryResult with all metrics and status
@@ -49,6 +60,10 @@ class QueryExecutor:
         start = time.perf_counter()
         
         try:
+            # Plan first so the timed run below does not include planning
+            self._warm_plan(limited_query)
+            start = time.perf_counter()
+            
             # Execute query with LIMIT
             records = list(self.session.run(limited_query))
             result.execution_time_ms = (time.perf_counter() - start) * 1000
@@ -56,38 +71,105 @@ class QueryExecutor:
             
             # Capture result rows (already limited to 10) with type conversion
             result.result_rows = [self._convert_record_to_dict(record) for record in records]
+            if row_mapper:
+                result.result_rows = [row_mapper(row) for row in result.result_rows]
             
-            # Tier 1: Query executed successfully = PASS (schema is valid)
-            result.status = "PASS"
-            
-            # Check for empty columns if we have data
-            if records:
-                result.empty_columns = self._check_empty_columns(records)
-            
-            # Tier 2: Apply expectations if provided
-            if expectation:
-                self._apply_expectations(result, records, expectation)
-            else:
-                # Default concerns without explicit expectations
-                if result.row_count == 0:
-                    result.status = "WARNING"
-                    result.details = "No data returned"
-                elif result.execution_time_ms > 1000:  # Default threshold
-                    result.status = "CONCERN"
-                    result.details = f"Slow query: {result.execution_time_ms:.0f}ms"
-                elif result.empty_columns:
-                    result.status = "CONCERN"
-                    result.details = f"Empty columns: {', '.join(result.empty_columns)}"
+            # Assess the rows as reported, so expectations see mapped columns
+            self._assess(result, result.result_rows, expectation)
             
         except Exception as e:
             result.execution_time_ms = (time.perf_counter() - start) * 1000
-            result.has_error = True
-            result.error_message = str(e)
-            result.status = "FAIL"
-            result.details = f"Query execution error: {str(e)}"
+            self._mark_failed(result, e)
         
         return result
     
+    def execute_partitioned(
+        self,
+        section: str,
+        query_text: str,
+        partition_column: str,
+        partitions: Dict[Any, Tuple[str, Optional[QueryExpectation]]],
+        reshapers: Optional[Dict[Any, Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]]] = None,
+        limit: int = 10
+    ) -> List[QueryResult]:
+        """
+        Execute one query and split its rows into several reported results.
+        
+        Used when multiple queries differ only in a property literal: a single
+        scan returns every variant tagged with partition_column, and each
+        variant is reported under its own query name and expectation.
+        
+        Args:
+            section: Section/category shared by all partitions
+            query_text: Cypher query returning partition_column in every row
+            partition_column: Column whose value selects the partition
+            partitions: Map of partition value -> (query_name, expectation)
+            reshapers: Optional map of partition value -> transform applied to
+                       that partition's rows (e.g., grouping into lists)
+            limit: Maximum rows kept per partition, mirroring execute()'s LIMIT
+            
+        Returns:
+            One QueryResult per partition, in the order of `partitions`
+        """
+        reshapers = reshapers or {}
+        results = {
+            value: QueryResult(
+                query_name=query_name,
+                section=section,
+                query_text=query_text,
+                expectation=expectation
+            )
+            for value, (query_name, expectation) in partitions.items()
+        }
+        
+        start = time.perf_counter()
+        
+        try:
+            # No automatic LIMIT: it would apply across partitions, not per partition
+            self._warm_plan(query_text)
+            start = time.perf_counter()
+            records = list(self.session.run(query_text))
+            execution_time_ms = (time.perf_counter() - start) * 1000
+            
+            grouped: Dict[Any, List[Dict[str, Any]]] = {value: [] for value in partitions}
+            for record in records:
+                row = self._convert_record_to_dict(record)
+                value = row.pop(partition_column)
+                if value in grouped:
+                    grouped[value].append(row)
+            
+            for value, result in results.items():
+                rows = grouped[value]
+                if value in reshapers:
+                    rows = reshapers[value](rows)
+                rows = rows[:limit]
+                
+                # The single scan's time is reported against every partition
+                result.execution_time_ms = execution_time_ms
+                result.row_count = len(rows)
+                result.result_rows = rows
+                self._assess(result, rows, result.expectation)
+            
+        except Exception as e:
+            execution_time_ms = (time.perf_counter() - start) * 1000
+            for result in results.values():
+                result.execution_time_ms = execution_time_ms
+                self._mark_failed(result, e)
+        
+        return list(results.values())
+    
+    def _warm_plan(self, query_text: str) -> None:
+        """
+        EXPLAIN a query the first time it is seen, priming Neo4j's plan cache.
+        
+        Plans are cached by exact query text, so this must be given the text
+        that is about to run. Errors propagate and fail the query as usual.
+        """
+        if query_text in self.warmed_queries:
+            return
+        self.warmed_queries.add(query_text)
+        self.session.run(f"EXPLAIN {query_text}").consume()
+    
     def _add_limit_if_missing(self, query: str, limit: int = 10) -> str:
         """Add LIMIT clause to query if not already present."""
         query_upper = query.upper()
@@ -133,6 +215,37 @@ class QueryExecutor:
         else:
             return value
     
+    def _assess(self, result: QueryResult, records: List[Any], expectation: Optional[QueryExpectation]) -> None:
+        """Set status and details for a successfully executed query."""
+        # Tier 1: Query executed successfully = PASS (schema is valid)
+        result.status = "PASS"
+        
+        # Check for empty columns if we have data
+        if records:
+            result.empty_columns = self._check_empty_columns(records)
+        
+        # Tier 2: Apply expectations if provided
+        if expectation:
+            self._apply_expectations(result, records, expectation)
+        else:
+            # Default concerns without explicit expectations
+            if result.row_count == 0:
+                result.status = "WARNING"
+                result.details = "No data returned"
+            elif result.execution_time_ms > 1000:  # Default threshold
+                result.status = "CONCERN"
+                result.details = f"Slow query: {result.execution_time_ms:.0f}ms"
+            elif result.empty_columns:
+                result.status = "CONCERN"
+                result.details = f"Empty columns: {', '.join(result.empty_columns)}"
+    
+    def _mark_failed(self, result: QueryResult, error: Exception) -> None:
+        """Record a query execution error on the result."""
+        result.has_error = True
+        result.error_message = str(error)
+        result.status = "FAIL"
+        result.details = f"Query execution error: {str(error)}"
+    
     def _check_empty_columns(self, records: List[Dict[str, Any]]) -> List[str]:
         """Identify columns that have all NULL/None values."""
         if not records:
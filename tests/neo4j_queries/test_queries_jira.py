@@ -266,9 +266,13 @@ def test_dependencies_and_blockers(query_executor, expectations, track_result):
 
 def test_epics_with_owners_and_teams(query_executor, expectations, track_result):
     """Complete epic context with owners, teams, and initiatives."""
+    # Expand from the most selective relationship (TEAM, typically one per epic)
+    # and carry the bound epic forward so the planner cannot reorder the joins.
     query = """
-    MATCH (e:Epic)-[:ASSIGNED_TO]->(owner:Person)
-    MATCH (e)-[:TEAM]->(team:Team)
+    MATCH (e:Epic)-[:TEAM]->(team:Team)
+    WITH e, team
+    MATCH (e)-[:ASSIGNED_TO]->(owner:Person)
+    WITH e, team, owner
     MATCH (e)-[:PART_OF]->(i:Initiative)
     RETURN e.key, e.summary, 
            owner.name as owner, owner.title as owner_title,
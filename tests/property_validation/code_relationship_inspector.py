@@ -3,8 +3,10 @@ Import and analyze relationship definitions from codebase.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Set, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Tuple, Optional
 
 # Add project root to path to import db.models
 project_root = Path(__file__).parent.parent.parent
@@ -13,6 +15,28 @@ sys.path.insert(0, str(project_root))
 from db.models import BIDIRECTIONAL_RELATIONSHIPS
 
 
+def _build_reverse_index() -> Dict[str, str]:
+    """
+    Map each different-name reverse type to its forward type.
+    
+    CONTAINS is the reverse of both PART_OF and IN_SPRINT; the first
+    definition wins, matching a front-to-back scan of BIDIRECTIONAL_RELATIONSHIPS.
+    """
+    reverse_index = {}
+    for forward, reverse in BIDIRECTIONAL_RELATIONSHIPS.items():
+        if reverse and reverse != forward:
+            reverse_index.setdefault(reverse, forward)
+    return reverse_index
+
+
+_REVERSE_INDEX = _build_reverse_index()
+
+# Every forward and reverse relationship name; invariant for the process lifetime
+ALL_RELATIONSHIP_NAMES: FrozenSet[str] = frozenset(
+    name for pair in BIDIRECTIONAL_RELATIONSHIPS.items() for name in pair if name
+)
+
+
 def get_expected_relationships() -> Dict[str, str]:
     """
     Get expected relationships from BIDIRECTIONAL_RELATIONSHIPS in db/models.py.
@@ -25,58 +49,51 @@ def get_expected_relationships() -> Dict[str, str]:
     return dict(BIDIRECTIONAL_RELATIONSHIPS)
 
 
-def get_all_relationship_names() -> Set[str]:
+def get_all_relationship_names() -> FrozenSet[str]:
     """
     Get all unique relationship names (both forward and reverse).
     
     Returns:
-        Set of all unique relationship type names
+        Frozen set of all unique relationship type names
     """
-    all_names = set()
-    for forward, reverse in BIDIRECTIONAL_RELATIONSHIPS.items():
-        all_names.add(forward)
-        if reverse:
-            all_names.add(reverse)
-    return all_names
+    return ALL_RELATIONSHIP_NAMES
 
 
-def categorize_relationships() -> Tuple[Set[str], Dict[str, Set[str]], Set[str]]:
+@lru_cache(maxsize=None)
+def categorize_relationships() -> Tuple[FrozenSet[str], Mapping[str, str], FrozenSet[str]]:
     """
     Categorize relationships by type.
     
+    The result is cached, so it is returned in read-only form.
+    
     Returns:
         Tuple of (same_name_bidirectional, different_name_bidirectional, unidirectional)
         - same_name_bidirectional: Set of relationship names that are same in both directions
         - different_name_bidirectional: Dict mapping forward->reverse for directional pairs
-        - unidirectional: Set of relationships that only go one way (reverse is None or not bidirectional)
+        - unidirectional: Set of relationships that only go one way (reverse is None)
     """
     same_name = set()
     different_name = {}
     unidirectional = set()
     
-    processed = set()
+    # Unordered pairs already recorded, so A -> B and B -> A yield one entry
+    seen_pairs = set()
     
     for forward, reverse in BIDIRECTIONAL_RELATIONSHIPS.items():
-        if forward in processed:
-            continue
-            
-        if forward == reverse:
-            # Same name bidirectional
+        if reverse == forward:
             same_name.add(forward)
-            processed.add(forward)
-        elif reverse and reverse in BIDIRECTIONAL_RELATIONSHIPS:
-            # Different name bidirectional (both directions exist in dict)
-            different_name[forward] = reverse
-            processed.add(forward)
-            processed.add(reverse)
+        elif reverse is None:
+            unidirectional.add(forward)
         else:
-            # Could be unidirectional or incomplete definition
-            # For now, treat as different-name if reverse exists
-            if reverse:
+            pair = frozenset((forward, reverse))
+            if pair not in seen_pairs:
+                seen_pairs.add(pair)
                 different_name[forward] = reverse
-                processed.add(forward)
     
-    return same_name, different_name, unidirectional
+    return frozenset(same_name), MappingProxyType(different_name), frozenset(unidirectional)
+
+
+SAME_NAME_BIDIRECTIONAL, DIFFERENT_NAME_BIDIRECTIONAL_PAIRS, UNIDIRECTIONAL_RELATIONSHIPS = categorize_relationships()
 
 
 def get_relationship_pair(rel_type: str) -> Optional[str]:
@@ -96,11 +113,15 @@ def get_relationship_pair(rel_type: str) -> Optional[str]:
         return reverse
     
     # Check if this is a reverse relationship
-    for forward, reverse in BIDIRECTIONAL_RELATIONSHIPS.items():
-        if reverse == rel_type and forward != reverse:
-            return forward
-    
-    return None
+    return _REVERSE_INDEX.get(rel_type)
+
+
+# Every relationship name with a different-name reverse, mapped to that reverse
+DIFFERENT_NAME_REVERSES: Mapping[str, str] = MappingProxyType({
+    name: reverse
+    for name in ALL_RELATIONSHIP_NAMES
+    if (reverse := get_relationship_pair(name))
+})
 
 
 def is_bidirectional(rel_type: str) -> bool:
@@ -113,15 +134,8 @@ def is_bidirectional(rel_type: str) -> bool:
     Returns:
         True if relationship is bidirectional (same or different name)
     """
-    if rel_type in BIDIRECTIONAL_RELATIONSHIPS:
-        return True
-    
-    # Check if it's a reverse relationship
-    for forward, reverse in BIDIRECTIONAL_RELATIONSHIPS.items():
-        if reverse == rel_type:
-            return True
-    
-    return False
+    # Forward name, or the reverse of a different-name pair
+    return rel_type in BIDIRECTIONAL_RELATIONSHIPS or rel_type in _REVERSE_INDEX
 
 
 def is_same_name_bidirectional(rel_type: str) -> bool:
@@ -134,7 +148,7 @@ def is_same_name_bidirectional(rel_type: str) -> bool:
     Returns:
         True if relationship uses same name bidirectionally
     """
-    return rel_type in BIDIRECTIONAL_RELATIONSHIPS and BIDIRECTIONAL_RELATIONSHIPS[rel_type] == rel_type
+    return rel_type in SAME_NAME_BIDIRECTIONAL
 
 
 def print_relationship_summary():
@@ -150,13 +164,11 @@ def print_relationship_summary():
     for name in sorted(same_name):
         print(f"  - {name} ↔ {name}")
     
-    print(f"\nDifferent-name bidirectional ({len(different_name)} pairs):")
-    processed = set()
-    for forward, reverse in sorted(different_name.items()):
-        if forward not in processed and reverse not in processed:
-            print(f"  - {forward} ↔ {reverse}")
-            processed.add(forward)
-            processed.add(reverse)
+    # Key by unordered pair so A ↔ B and B ↔ A print once
+    pairs = sorted({frozenset((forward, reverse)): (forward, reverse) for forward, reverse in different_name.items()}.values())
+    print(f"\nDifferent-name bidirectional ({len(pairs)} pairs):")
+    for forward, reverse in pairs:
+        print(f"  - {forward} ↔ {reverse}")
     
     if unidirectional:
         print(f"\nUnidirectional ({len(unidirectional)}):")
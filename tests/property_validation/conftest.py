@@ -0,0 +1,72 @@
+"""
+Pytest fixtures shared by the property validation tests.
+"""
+
+import os
+import pytest
+
+from tests.property_validation.connection import build_driver, database_name
+from tests.property_validation.model_inspector import discover_entity_types
+from tests.property_validation.models import ValidationReport
+from tests.property_validation.relationship_inspector import discover_all_relationships
+from tests.property_validation.validator import PropertyValidator
+
+
+@pytest.fixture(scope="session")
+def neo4j_driver():
+    """
+    Create one Neo4j driver for the whole test session.
+    Sharing it keeps the connection pool warm across test modules.
+    """
+    if not os.getenv('NEO4J_PASSWORD'):
+        pytest.skip("NEO4J_PASSWORD environment variable not set")
+    
+    driver = build_driver()
+    
+    # Verify connection
+    try:
+        driver.verify_connectivity()
+    except Exception as e:
+        pytest.skip(f"Could not connect to Neo4j: {e}")
+    
+    yield driver
+    
+    driver.close()
+
+
+@pytest.fixture(scope="session")
+def entity_types():
+    """Entity types introspected from db/models.py; needs no Neo4j connection."""
+    return discover_entity_types()
+
+
+@pytest.fixture(scope="session")
+def discovered_relationships(neo4j_driver):
+    """Discover relationship types and their properties once per session."""
+    with neo4j_driver.session(database=database_name()) as session:
+        return discover_all_relationships(session)
+
+
+@pytest.fixture(scope="session")
+def validation_report(request, neo4j_driver, discovered_relationships):
+    """
+    Run validation once per session and share the report across test modules.
+    
+    With PROPERTY_VALIDATION_CACHE=1 the report is also stored in pytest's
+    cache and reused by later runs while the graph fingerprint is unchanged.
+    """
+    validator = PropertyValidator(neo4j_driver)
+    if not os.getenv("PROPERTY_VALIDATION_CACHE"):
+        return validator.validate_all(discovered_relationships)
+    
+    cache = request.config.cache
+    fingerprint = validator.graph_fingerprint(discovered_relationships)
+    if cache.get("property_validation/fingerprint", None) == fingerprint:
+        cached = cache.get("property_validation/report", None)
+        if cached is not None:
+            return ValidationReport.from_dict(cached)
+    
+    report = validator.validate_all(discovered_relationships)
+    cache.set("property_validation/report", report.to_dict())
+    cache.set("property_validation/fingerprint", fingerprint)
+    return report
@@ -0,0 +1,65 @@
+"""
+Shared Neo4j driver construction for property validation.
+"""
+
+import os
+from typing import Any, Dict, Tuple
+
+from neo4j import Driver, GraphDatabase
+
+
+def connection_settings() -> Tuple[str, Tuple[str, str]]:
+    """
+    Read connection settings from the environment.
+
+    Returns:
+        Tuple of (uri, (username, password))
+    """
+    uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
+    username = os.getenv('NEO4J_USERNAME', 'neo4j')
+    password = os.getenv('NEO4J_PASSWORD', 'password')
+    return uri, (username, password)
+
+
+def database_name() -> str:
+    """
+    Read the target database from NEO4J_DATABASE (default "neo4j").
+    
+    Naming the database on each session saves the driver a home-database
+    lookup and keeps query plans cached against one database.
+    
+    Returns:
+        Database name
+    """
+    return os.getenv('NEO4J_DATABASE', 'neo4j')
+
+
+def pool_settings() -> Dict[str, Any]:
+    """
+    Read connection pool settings from the environment.
+
+    NEO4J_MAX_POOL_SIZE (default 64) bounds how many queries can run
+    concurrently; NEO4J_ACQUIRE_TIMEOUT (seconds, default 60) is how long a
+    query waits for a free connection.
+
+    Returns:
+        Keyword arguments for GraphDatabase.driver
+    """
+    return {
+        "max_connection_pool_size": int(os.getenv('NEO4J_MAX_POOL_SIZE', '64')),
+        "connection_acquisition_timeout": float(os.getenv('NEO4J_ACQUIRE_TIMEOUT', '60')),
+    }
+
+
+def build_driver() -> Driver:
+    """
+    Create a Neo4j driver from environment settings.
+
+    Create it once per process (or pytest session) and share it, so the
+    connection pool is only warmed once.
+
+    Returns:
+        Neo4j driver
+    """
+    uri, auth = connection_settings()
+    return GraphDatabase.driver(uri, auth=auth, **pool_settings())
@@ -3,9 +3,11 @@ Dynamically introspect db/models.py to discover entity types and properties.
 """
 
 import sys
+import types
 import inspect
+from functools import lru_cache
 from dataclasses import fields, is_dataclass
-from typing import Dict, get_origin, get_args, Any
+from typing import Mapping, Union, get_origin, get_args, get_type_hints, Any
 from pathlib import Path
 
 # Add project root to path for imports
@@ -15,9 +17,10 @@ sys.path.insert(0, str(project_root))
 from tests.property_validation.models import EntityMetadata, PropertyMetadata
 
 
+@lru_cache(maxsize=256)
 def is_optional_field(field_type: Any) -> bool:
     """
-    Check if a field is Optional (i.e., Union[T, None]).
+    Check if a field is Optional (i.e., Union[T, None] or T | None).
     
     Args:
         field_type: The type annotation of the field
@@ -26,16 +29,36 @@ def is_optional_field(field_type: Any) -> bool:
         True if the field is Optional, False otherwise
     """
     origin = get_origin(field_type)
-    if origin is None:
-        return False
+    # Optional[T] is actually Union[T, None]
+    return (origin is Union or origin is types.UnionType) and type(None) in get_args(field_type)
+
+
+@lru_cache(maxsize=None)
+def _pretty_type(field_type: Any) -> str:
+    """
+    Render a resolved type annotation for display (e.g., "Optional[str]", "List[str]").
+    
+    Args:
+        field_type: A resolved type annotation
+        
+    Returns:
+        Readable type name
+    """
+    args = get_args(field_type)
+    if not args:
+        return getattr(field_type, '__name__', str(field_type))
     
-    # Check if it's a Union type
-    if hasattr(origin, '__name__') and origin.__name__ == 'Union':
-        args = get_args(field_type)
-        # Optional[T] is actually Union[T, None]
-        return type(None) in args
+    origin = get_origin(field_type)
+    if origin is Union or origin is types.UnionType:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(args) == 2:
+            return f"Optional[{_pretty_type(non_none[0])}]"
+        name = 'Union'
+    else:
+        # typing aliases (List, Dict) carry their display name in _name
+        name = getattr(field_type, '_name', None) or getattr(origin, '__name__', str(origin))
     
-    return False
+    return f"{name}[{', '.join(_pretty_type(arg) for arg in args)}]"
 
 
 def extract_properties(entity_class: type) -> list[PropertyMetadata]:
@@ -51,35 +74,40 @@ def extract_properties(entity_class: type) -> list[PropertyMetadata]:
     if not is_dataclass(entity_class):
         return []
     
+    # db/models.py uses postponed annotations, so field.type is a string;
+    # resolve the real types once per class
+    try:
+        hints = get_type_hints(entity_class)
+    except Exception:
+        hints = {}
+    
     properties = []
     for field_obj in fields(entity_class):
         # Skip internal/metadata fields
         if field_obj.name.startswith('_'):
             continue
         
-        # Determine if field is optional
-        is_optional = is_optional_field(field_obj.type)
-        
-        # Get type as string for display
-        type_str = str(field_obj.type)
-        # Clean up type string for readability
-        type_str = type_str.replace('typing.', '').replace('<class ', '').replace('>', '').replace("'", '')
+        field_type = hints.get(field_obj.name, field_obj.type)
         
         properties.append(PropertyMetadata(
             name=field_obj.name,
-            python_type=type_str,
-            is_optional=is_optional
+            python_type=_pretty_type(field_type),
+            is_optional=is_optional_field(field_type)
         ))
     
     return properties
 
 
-def discover_entity_types() -> Dict[str, EntityMetadata]:
+@lru_cache(maxsize=1)
+def discover_entity_types() -> Mapping[str, EntityMetadata]:
     """
     Discover all entity types from db/models.py.
     
+    The result is cached for the life of the process, so it is returned in
+    read-only form; call discover_entity_types.cache_clear() after reloading db.models.
+    
     Returns:
-        Dictionary mapping entity name to EntityMetadata
+        Read-only mapping of entity name to EntityMetadata
     """
     import db.models as models
     
@@ -109,13 +137,13 @@ def discover_entity_types() -> Dict[str, EntityMetadata]:
         if properties:  # Only include entities with properties
             entity_metadata[name] = EntityMetadata(
                 entity_name=name,
-                properties=properties
+                properties=tuple(properties)
             )
     
-    return entity_metadata
+    return types.MappingProxyType(entity_metadata)
 
 
-def print_discovered_entities(entities: Dict[str, EntityMetadata]) -> None:
+def print_discovered_entities(entities: Mapping[str, EntityMetadata]) -> None:
     """
     Print discovered entities in a readable format.
     
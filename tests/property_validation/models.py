@@ -2,10 +2,61 @@
 Data models for property validation results.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+import gzip
+import io
+import json
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+from typing import List, Dict, Optional, Any, TextIO, Tuple
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json encoder
+    orjson = None
+
+
+# Report files are written through a 1 MiB buffer so many small writes become few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def open_report_file(path: Path) -> TextIO:
+    """
+    Open a report file for writing UTF-8 text through WRITE_BUFFER_SIZE.
+    
+    Paths ending in .gz are gzip-compressed at level 1, which costs little
+    CPU and shrinks large JSON/HTML reports several times over.
+    
+    Args:
+        path: File to write
+        
+    Returns:
+        Writable text stream
+    """
+    if str(path).endswith('.gz'):
+        compressed = gzip.GzipFile(path, 'wb', compresslevel=1)
+        return io.TextIOWrapper(io.BufferedWriter(compressed, WRITE_BUFFER_SIZE), encoding='utf-8')
+    return open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+
+def _encode_json(value: Any) -> str:
+    """Encode one JSON value, using orjson when installed."""
+    if orjson is None:
+        return json.dumps(value, separators=(',', ':'))
+    return orjson.dumps(value).decode('utf-8')
+
+
+def _json_dict_factory(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """dict_factory for dataclasses.asdict that emits JSON-ready enum and datetime values."""
+    return {
+        key: value.value if isinstance(value, Enum)
+        else value.isoformat() if isinstance(value, datetime)
+        else value
+        for key, value in items
+    }
 
 
 class PopulationCategory(Enum):
@@ -15,7 +66,7 @@ class PopulationCategory(Enum):
     EMPTY = "EMPTY"        # 0% populated
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertyMetadata:
     """Metadata about a property from the dataclass definition."""
     name: str
@@ -23,14 +74,14 @@ class PropertyMetadata:
     is_optional: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntityMetadata:
     """Metadata about an entity type discovered from models.py."""
     entity_name: str
-    properties: List[PropertyMetadata]
+    properties: Tuple[PropertyMetadata, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyValidationResult:
     """Validation result for a single property."""
     property_name: str
@@ -41,22 +92,14 @@ class PropertyValidationResult:
     population_percentage: float
     category: PopulationCategory
     is_required: bool
+    sampled: bool = False  # Counted over a capped subset rather than every instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            'property_name': self.property_name,
-            'entity_or_rel_type': self.entity_or_rel_type,
-            'total_count': self.total_count,
-            'populated_count': self.populated_count,
-            'empty_count': self.empty_count,
-            'population_percentage': self.population_percentage,
-            'category': self.category.value,
-            'is_required': self.is_required
-        }
+        return asdict(self, dict_factory=_json_dict_factory)
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipExistenceResult:
     """Validation result for relationship existence and consistency."""
     rel_type: str
@@ -71,41 +114,26 @@ class RelationshipExistenceResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            'rel_type': self.rel_type,
-            'total_count': self.total_count,
-            'has_properties': self.has_properties,
-            'is_expected': self.is_expected,
-            'is_bidirectional': self.is_bidirectional,
-            'is_same_name_bidirectional': self.is_same_name_bidirectional,
-            'reverse_rel_type': self.reverse_rel_type,
-            'reverse_count': self.reverse_count,
-            'count_discrepancy': self.count_discrepancy
-        }
+        return asdict(self, dict_factory=_json_dict_factory)
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipCoverageResult:
     """Summary of relationship coverage against expected definitions."""
     expected_count: int
     discovered_count: int
-    missing_relationships: List[str] = field(default_factory=list)
-    unexpected_relationships: List[str] = field(default_factory=list)
-    bidirectional_mismatches: List[str] = field(default_factory=list)
+    missing_relationships: Tuple[str, ...] = ()
+    unexpected_relationships: Tuple[str, ...] = ()
+    bidirectional_mismatches: Tuple[str, ...] = ()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            'expected_count': self.expected_count,
-            'discovered_count': self.discovered_count,
-            'missing_relationships': self.missing_relationships,
-            'unexpected_relationships': self.unexpected_relationships,
-            'bidirectional_mismatches': self.bidirectional_mismatches,
-            'coverage_percentage': (self.discovered_count / self.expected_count * 100) if self.expected_count > 0 else 0.0
-        }
+        data = asdict(self, dict_factory=_json_dict_factory)
+        data['coverage_percentage'] = (self.discovered_count / self.expected_count * 100) if self.expected_count > 0 else 0.0
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report for all entities and relationships."""
     timestamp: datetime
@@ -117,60 +145,113 @@ class ValidationReport:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            'timestamp': self.timestamp.isoformat(),
-            'entity_results': {
-                entity_type: [result.to_dict() for result in results]
-                for entity_type, results in self.entity_results.items()
-            },
-            'relationship_results': {
-                rel_type: [result.to_dict() for result in results]
-                for rel_type, results in self.relationship_results.items()
-            },
-            'relationship_existence': {
-                rel_type: result.to_dict()
-                for rel_type, result in self.relationship_existence.items()
+        data = asdict(self, dict_factory=_json_dict_factory)
+        # Coverage carries a derived percentage that asdict does not produce
+        data['relationship_coverage'] = self.relationship_coverage.to_dict() if self.relationship_coverage else None
+        data['summary'] = self._generate_summary()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationReport':
+        """
+        Rebuild a report from to_dict() output (e.g., a report loaded from JSON).
+        
+        Derived values (summary, coverage percentage) are ignored and recomputed on demand.
+        """
+        def property_results(results_by_type: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[PropertyValidationResult]]:
+            return {
+                type_name: [
+                    PropertyValidationResult(**{**result, 'category': PopulationCategory(result['category'])})
+                    for result in results
+                ]
+                for type_name, results in results_by_type.items()
+            }
+        
+        coverage = data.get('relationship_coverage')
+        return cls(
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            entity_results=property_results(data['entity_results']),
+            relationship_results=property_results(data['relationship_results']),
+            relationship_existence={
+                rel_type: RelationshipExistenceResult(**result)
+                for rel_type, result in data.get('relationship_existence', {}).items()
             },
-            'relationship_coverage': self.relationship_coverage.to_dict() if self.relationship_coverage else None,
-            'failure_count': self.failure_count,
-            'summary': self._generate_summary()
-        }
+            relationship_coverage=RelationshipCoverageResult(
+                expected_count=coverage['expected_count'],
+                discovered_count=coverage['discovered_count'],
+                missing_relationships=tuple(coverage['missing_relationships']),
+                unexpected_relationships=tuple(coverage['unexpected_relationships']),
+                bidirectional_mismatches=tuple(coverage['bidirectional_mismatches'])
+            ) if coverage else None,
+            failure_count=data.get('failure_count', 0)
+        )
     
-    def _generate_summary(self) -> Dict[str, Any]:
-        """Generate summary statistics."""
-        total_properties = sum(len(results) for results in self.entity_results.values())
-        total_rel_properties = sum(len(results) for results in self.relationship_results.values())
+    def write_json(
+        self,
+        path: Path,
+        summary: Optional[Dict[str, Any]] = None,
+        pretty: bool = False
+    ) -> None:
+        """
+        Write the report to a JSON file, encoding one result at a time.
+        
+        Produces the same document as to_dict() without building the full
+        nested dict, so peak memory stays at a single result beyond the report.
         
-        full_count = 0
-        partial_count = 0
-        empty_count = 0
+        Args:
+            path: File to write (gzip-compressed if it ends in .gz)
+            summary: Precomputed _generate_summary() output, computed if not given
+            pretty: Indent the document structure, one result per line;
+                    compact (no whitespace) by default
+        """
+        if summary is None:
+            summary = self._generate_summary()
         
-        for results in self.entity_results.values():
-            for result in results:
-                if result.category == PopulationCategory.FULL:
-                    full_count += 1
-                elif result.category == PopulationCategory.PARTIAL:
-                    partial_count += 1
-                else:
-                    empty_count += 1
+        # Line breaks + indentation before keys at each nesting level
+        if pretty:
+            end, br1, br2, br3, colon = '\n', '\n  ', '\n    ', '\n      ', ': '
+        else:
+            end = br1 = br2 = br3 = ''
+            colon = ':'
         
-        for results in self.relationship_results.values():
-            for result in results:
-                if result.category == PopulationCategory.FULL:
-                    full_count += 1
-                elif result.category == PopulationCategory.PARTIAL:
-                    partial_count += 1
-                else:
-                    empty_count += 1
+        with open_report_file(path) as f:
+            f.write('{')
+            f.write(f'{br1}"timestamp"{colon}{_encode_json(self.timestamp.isoformat())},')
+            
+            for key, results_by_type in (('entity_results', self.entity_results),
+                                         ('relationship_results', self.relationship_results)):
+                f.write(f'{br1}"{key}"{colon}{{')
+                for i, (type_name, results) in enumerate(results_by_type.items()):
+                    f.write(f'{"," if i else ""}{br2}{_encode_json(type_name)}{colon}[')
+                    for j, result in enumerate(results):
+                        f.write(f'{"," if j else ""}{br3}{_encode_json(result.to_dict())}')
+                    f.write(f'{br2}]' if results else ']')
+                f.write(f'{br1}}},' if results_by_type else '},')
+            
+            f.write(f'{br1}"relationship_existence"{colon}{{')
+            for i, (rel_type, result) in enumerate(self.relationship_existence.items()):
+                f.write(f'{"," if i else ""}{br2}{_encode_json(rel_type)}{colon}{_encode_json(result.to_dict())}')
+            f.write(f'{br1}}},' if self.relationship_existence else '},')
+            
+            coverage = self.relationship_coverage.to_dict() if self.relationship_coverage else None
+            f.write(f'{br1}"relationship_coverage"{colon}{_encode_json(coverage)},')
+            f.write(f'{br1}"failure_count"{colon}{_encode_json(self.failure_count)},')
+            f.write(f'{br1}"summary"{colon}{_encode_json(summary)}')
+            f.write(f'{end}}}\n')
+    
+    def _generate_summary(self) -> Dict[str, Any]:
+        """Generate summary statistics."""
+        all_results = chain(self.entity_results.values(), self.relationship_results.values())
+        counts = Counter(result.category for results in all_results for result in results)
         
         summary = {
             'total_entity_types': len(self.entity_results),
             'total_relationship_types': len(self.relationship_results),
             'total_relationship_existence_checks': len(self.relationship_existence),
-            'total_properties_validated': total_properties + total_rel_properties,
-            'full_population': full_count,
-            'partial_population': partial_count,
-            'empty_population': empty_count,
+            'total_properties_validated': sum(counts.values()),
+            'full_population': counts[PopulationCategory.FULL],
+            'partial_population': counts[PopulationCategory.PARTIAL],
+            'empty_population': counts[PopulationCategory.EMPTY],
             'failures': self.failure_count
         }
         
@@ -2,6 +2,9 @@
 Generate Cypher queries for property validation.
 """
 
+from functools import lru_cache
+from typing import List
+
 
 def generate_node_property_query(label: str, property_name: str) -> str:
     """
@@ -67,6 +70,112 @@ def generate_relationship_property_query(rel_type: str, property_name: str) -> s
     return query.strip()
 
 
+@lru_cache(maxsize=None)
+def generate_node_properties_bulk_query(label: str, sampled: bool = False) -> str:
+    """
+    Generate a Cypher query that validates population of many node properties at once.
+    
+    The label is scanned once; property names are passed as the `$props`
+    parameter and the query returns one row per property with the same
+    populated semantics as generate_node_property_query, plus the populated
+    percentage. A label with no nodes returns no rows.
+    
+    Args:
+        label: The node label (e.g., "Person", "Repository")
+        sampled: Count only the first $limit nodes instead of scanning the label
+        
+    Returns:
+        Cypher query string (run with props=[...], plus limit=N when sampled)
+    """
+    sample = "\n    WITH n LIMIT $limit" if sampled else ""
+    query = f"""
+    MATCH (n:`{label}`){sample}
+    UNWIND $props as prop_name
+    WITH prop_name, n[prop_name] as prop
+    WITH prop_name,
+         count(*) as total,
+         count(CASE 
+             WHEN prop IS NOT NULL 
+             AND prop <> '' 
+             AND prop <> []
+             THEN 1 
+         END) as populated
+    RETURN prop_name, total, populated,
+           CASE WHEN total = 0 THEN 0.0 ELSE toFloat(populated) / total * 100.0 END as percentage
+    """
+    return query.strip()
+
+
+@lru_cache(maxsize=None)
+def generate_relationship_properties_bulk_query(rel_type: str, sampled: bool = False) -> str:
+    """
+    Generate a Cypher query that validates population of many relationship properties at once.
+    
+    Relationship equivalent of generate_node_properties_bulk_query.
+    
+    Args:
+        rel_type: The relationship type (e.g., "COLLABORATOR", "MODIFIES")
+        sampled: Count only the first $limit relationships instead of scanning the type
+        
+    Returns:
+        Cypher query string (run with props=[...], plus limit=N when sampled)
+    """
+    sample = "\n    WITH r LIMIT $limit" if sampled else ""
+    query = f"""
+    MATCH ()-[r:`{rel_type}`]->(){sample}
+    UNWIND $props as prop_name
+    WITH prop_name, r[prop_name] as prop
+    WITH prop_name,
+         count(*) as total,
+         count(CASE 
+             WHEN prop IS NOT NULL 
+             AND prop <> '' 
+             AND prop <> []
+             THEN 1 
+         END) as populated
+    RETURN prop_name, total, populated,
+           CASE WHEN total = 0 THEN 0.0 ELSE toFloat(populated) / total * 100.0 END as percentage
+    """
+    return query.strip()
+
+
+def generate_label_counts_query(labels: List[str]) -> str:
+    """
+    Generate a Cypher query returning the node count of every label in one round-trip.
+    
+    Each label gets its own UNION branch with a literal label, so every
+    count is answered from Neo4j's count store without scanning nodes.
+    
+    Args:
+        labels: Node labels to count
+        
+    Returns:
+        Cypher query string (run with names=labels) yielding rows of (name, total)
+    """
+    return "\nUNION ALL\n".join(
+        f"MATCH (n:`{label}`) RETURN $names[{i}] as name, count(n) as total"
+        for i, label in enumerate(labels)
+    )
+
+
+def generate_relationship_counts_query(rel_types: List[str]) -> str:
+    """
+    Generate a Cypher query returning the count of every relationship type in one round-trip.
+    
+    Relationship equivalent of generate_label_counts_query.
+    
+    Args:
+        rel_types: Relationship types to count
+        
+    Returns:
+        Cypher query string (run with names=rel_types) yielding rows of (name, total)
+    """
+    return "\nUNION ALL\n".join(
+        f"MATCH ()-[r:`{rel_type}`]->() RETURN $names[{i}] as name, count(r) as total"
+        for i, rel_type in enumerate(rel_types)
+    )
+
+
 if __name__ == "__main__":
     # Test query generation
     print("Node property query example:")
@@ -74,3 +183,6 @@ if __name__ == "__main__":
     print("\n" + "="*80 + "\n")
     print("Relationship property query example:")
     print(generate_relationship_property_query("COLLABORATOR", "permission"))
+    print("\n" + "="*80 + "\n")
+    print("Bulk node property query example:")
+    print(generate_node_properties_bulk_query("Person"))
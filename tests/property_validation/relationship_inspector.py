@@ -2,8 +2,13 @@
 Discover relationship types and their properties from Neo4j database.
 """
 
+import logging
 from typing import Dict, List, Set
 from neo4j import Session
+from neo4j.exceptions import ClientError
+
+
+logger = logging.getLogger(__name__)
 
 
 def discover_relationship_types(session: Session) -> List[str]:
@@ -23,40 +28,111 @@ def discover_relationship_types(session: Session) -> List[str]:
     return sorted(rel_types)
 
 
-def discover_relationship_properties(session: Session, rel_type: str) -> List[str]:
+def _discover_properties_for_types(session: Session, rel_types: List[str]) -> Dict[str, List[str]]:
     """
-    Discover properties for a specific relationship type.
+    Discover properties for several relationship types in a single query.
+    
+    Each type gets its own UNION branch so the planner can use a relationship
+    type scan (types cannot be passed as parameters); all branches travel in
+    one round-trip. If the batch fails, each type is retried on its own so
+    only the failing types come back empty.
     
     Args:
         session: Neo4j session
-        rel_type: The relationship type to inspect
+        rel_types: Relationship types to inspect
         
     Returns:
-        List of property names found on this relationship type
+        Dictionary mapping relationship type to sorted list of property names
     """
+    if not rel_types:
+        return {}
+    
     # Sample relationships to find all possible properties
     # We use LIMIT to avoid scanning the entire database
-    query = f"""
+    branches = [
+        f"""
     MATCH ()-[r:`{rel_type}`]->()
     WITH r LIMIT 1000
     UNWIND keys(r) as key
-    RETURN DISTINCT key
-    ORDER BY key
+    RETURN $rel_types[{i}] as rel_type, collect(DISTINCT key) as properties
     """
+        for i, rel_type in enumerate(rel_types)
+    ]
+    query = "UNION ALL".join(branches)
     
+    # A branch whose relationships have no properties returns no row, so
+    # every type starts out with an empty list
+    properties: Dict[str, List[str]] = {rel_type: [] for rel_type in rel_types}
     try:
-        result = session.run(query)
-        properties = [record["key"] for record in result]
-        return properties
+        for record in session.run(query, rel_types=rel_types):
+            properties[record["rel_type"]] = sorted(record["properties"])
     except Exception as e:
-        print(f"Warning: Could not discover properties for relationship type '{rel_type}': {e}")
-        return []
+        if len(rel_types) == 1:
+            logger.warning("Could not discover properties for %s: %s", rel_types[0], e)
+            return properties
+        logger.warning("Batched property discovery failed, retrying per relationship type: %s", e)
+        for rel_type in rel_types:
+            properties.update(_discover_properties_for_types(session, [rel_type]))
+    
+    return properties
+
+
+def discover_relationship_properties(session: Session, rel_type: str) -> List[str]:
+    """
+    Discover properties for a specific relationship type.
+    
+    Args:
+        session: Neo4j session
+        rel_type: The relationship type to inspect
+        
+    Returns:
+        List of property names found on this relationship type
+    """
+    return _discover_properties_for_types(session, [rel_type]).get(rel_type, [])
+
+
+def _schema_type_name(schema_type: str) -> str:
+    """Convert a schema procedure type name like ":`REPORTS_TO`" to "REPORTS_TO"."""
+    name = schema_type.lstrip(':')
+    if name.startswith('`') and name.endswith('`'):
+        name = name[1:-1].replace('``', '`')
+    return name
+
+
+def discover_relationship_properties_from_schema(session: Session) -> Dict[str, List[str]]:
+    """
+    Discover relationship types and properties with db.schema.relTypeProperties().
+    
+    A single procedure call covers every type, so no per-type sampling
+    query is needed.
+    
+    Args:
+        session: Neo4j session
+        
+    Returns:
+        Dictionary mapping relationship type to sorted list of property names
+        
+    Raises:
+        ClientError: If the procedure is not available
+    """
+    relationship_metadata: Dict[str, Set[str]] = {}
+    for record in session.run("CALL db.schema.relTypeProperties() YIELD relType, propertyName"):
+        properties = relationship_metadata.setdefault(_schema_type_name(record["relType"]), set())
+        # propertyName is null for types without properties
+        if record["propertyName"]:
+            properties.add(record["propertyName"])
+    
+    return {rel_type: sorted(props) for rel_type, props in sorted(relationship_metadata.items())}
 
 
 def discover_all_relationships(session: Session) -> Dict[str, List[str]]:
     """
     Discover all relationship types and their properties.
     
+    Uses db.schema.relTypeProperties() when available. Otherwise falls back
+    to sampling, which takes two round-trips regardless of how many types
+    exist: one to list the types and one batched query for their properties.
+    
     Args:
         session: Neo4j session
         
@@ -64,15 +140,15 @@ def discover_all_relationships(session: Session) -> Dict[str, List[str]]:
         Dictionary mapping relationship type to list of property names
         (empty list if relationship has no properties)
     """
-    rel_types = discover_relationship_types(session)
+    try:
+        return discover_relationship_properties_from_schema(session)
+    except ClientError as e:
+        logger.warning("db.schema.relTypeProperties() unavailable, sampling relationships instead: %s", e)
     
-    relationship_metadata = {}
-    for rel_type in rel_types:
-        properties = discover_relationship_properties(session, rel_type)
-        # Include ALL relationships, even those without properties
-        relationship_metadata[rel_type] = properties
+    rel_types = discover_relationship_types(session)
     
-    return relationship_metadata
+    # Include ALL relationships, even those without properties
+    return _discover_properties_for_types(session, rel_types)
 
 
 def print_discovered_relationships(relationships: Dict[str, List[str]]) -> None:
@@ -99,17 +175,12 @@ def print_discovered_relationships(relationships: Dict[str, List[str]]) -> None:
 
 if __name__ == "__main__":
     # Test the discovery function (requires Neo4j connection)
-    import os
-    from neo4j import GraphDatabase
-    
-    uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
-    username = os.getenv('NEO4J_USERNAME', 'neo4j')
-    password = os.getenv('NEO4J_PASSWORD', 'password')
+    from tests.property_validation.connection import build_driver, database_name
     
-    driver = GraphDatabase.driver(uri, auth=(username, password))
+    driver = build_driver()
     
     try:
-        with driver.session() as session:
+        with driver.session(database=database_name()) as session:
             relationships = discover_all_relationships(session)
             print_discovered_relationships(relationships)
             print(f"Total relationship types with properties: {len(relationships)}")
@@ -2,10 +2,27 @@
 Generate reports for property validation results.
 """
 
-import json
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import List
-from tests.property_validation.models import ValidationReport, PropertyValidationResult, PopulationCategory
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+from tests.property_validation.models import (
+    ValidationReport,
+    PropertyValidationResult,
+    RelationshipExistenceResult,
+    PopulationCategory,
+    open_report_file
+)
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for generate_msgpack_report
+    msgpack = None
 
 
 # ANSI color codes for console output
@@ -19,295 +36,454 @@ class Colors:
     RESET = '\033[0m'
 
 
-def generate_console_report(report: ValidationReport) -> None:
+# Honor NO_COLOR (https://no-color.org) and skip escape codes when output is redirected
+if os.environ.get('NO_COLOR') or not sys.stdout.isatty():
+    Colors.GREEN = Colors.YELLOW = Colors.RED = Colors.BLUE = Colors.BOLD = Colors.RESET = ''
+
+# HTML-escape names once; the same entity/property/relationship names repeat across rows
+_esc = lru_cache(maxsize=4096)(escape)
+
+# Table rules and section banners
+_SEP_EQ = '=' * 100
+_SEP_DASH = '-' * 100
+_BANNER_TOP = f"{Colors.BOLD}{_SEP_EQ}"
+_BANNER_BOTTOM = f"{_SEP_EQ}{Colors.RESET}\n"
+
+# Common relationship existence cells
+_DASH = "-"
+_PROPS_YES = f"{Colors.GREEN}Yes{Colors.RESET}"
+_BIDIR_SAME = f"{Colors.GREEN}Same name{Colors.RESET}"
+_BIDIR_YES = f"{Colors.BLUE}Yes{Colors.RESET}"
+_DIFF_ZERO = f"{Colors.GREEN}0{Colors.RESET}"
+
+# Plain string value of each category, for sort keys and CSS class names
+_CAT_VALUE = {category: category.value for category in PopulationCategory}
+
+# Color and colored label for each population category in console tables
+_CAT_COLOR = {
+    PopulationCategory.FULL: Colors.GREEN,
+    PopulationCategory.PARTIAL: Colors.YELLOW,
+    PopulationCategory.EMPTY: Colors.RED,
+}
+_CAT_STRS = {category: f"{color}{category.value}{Colors.RESET}" for category, color in _CAT_COLOR.items()}
+_CAT_EMPTY_REQUIRED_STR = f"{Colors.RED}{Colors.BOLD}EMPTY ❌{Colors.RESET}"
+_PCT_SUFFIX = f"%{Colors.RESET}"
+
+# Row layouts, formatted once per row
+_ENTITY_ROW_FMT = "{name:<30} {req:<10} {total:<8} {populated:<10} {empty:<8} {pct:<15} {category}"
+_RELATIONSHIP_ROW_FMT = "{name:<30} {total:<8} {populated:<10} {empty:<8} {pct:<15} {category}"
+# Table heads and closing tags shared by every section
+_HTML_ENTITY_THEAD = (
+    '<table>\n<thead>\n<tr>\n'
+    '<th>Property</th><th>Required</th><th>Total</th><th>Populated</th><th>Empty</th><th>%</th><th>Category</th>\n'
+    '</tr>\n</thead>\n<tbody>\n'
+)
+_HTML_RELATIONSHIP_THEAD = (
+    '<table>\n<thead>\n<tr>\n'
+    '<th>Property</th><th>Total</th><th>Populated</th><th>Empty</th><th>%</th><th>Category</th>\n'
+    '</tr>\n</thead>\n<tbody>\n'
+)
+_HTML_EXISTENCE_THEAD = (
+    '<table>\n<thead>\n<tr>\n'
+    '<th>Relationship</th><th>Count</th><th>Has Properties</th><th>Expected</th>'
+    '<th>Bidirectional</th><th>Reverse Rel</th><th>Reverse Count</th><th>Discrepancy</th>\n'
+    '</tr>\n</thead>\n<tbody>\n'
+)
+_HTML_TABLE_END = '</tbody>\n</table>\n</div>\n'
+
+# data-search holds each row's lowercased search text so filtering skips textContent
+_HTML_ENTITY_ROW = (
+    '<tr data-search="{search}">\n'
+    '<td>{name}{badge}</td>\n'
+    '<td class="{req_class}">{req_text}</td>\n'
+    '<td>{total}</td>\n'
+    '<td>{populated}</td>\n'
+    '<td>{empty}</td>\n'
+    '<td>{pct:.2f}%</td>\n'
+    '<td><span class="category-{category}">{category}</span></td>\n'
+    '</tr>\n'
+)
+_HTML_RELATIONSHIP_ROW = (
+    '<tr data-search="{search}">\n'
+    '<td>{name}</td>\n'
+    '<td>{total}</td>\n'
+    '<td>{populated}</td>\n'
+    '<td>{empty}</td>\n'
+    '<td>{pct:.2f}%</td>\n'
+    '<td><span class="category-{category}">{category}</span></td>\n'
+    '</tr>\n'
+)
+_HTML_CHECK = '✓'
+_HTML_DASH = '—'
+# Unexpected relationships are highlighted in the existence table
+_HTML_UNEXPECTED_ROW = 'style="background-color: #fff3cd;"'
+_HTML_EXISTENCE_ROW = (
+    '<tr {row_class}>\n'
+    '<td><strong>{rel_type}</strong></td>\n'
+    '<td>{total}</td>\n'
+    '<td>{has_props}</td>\n'
+    '<td>{is_expected}</td>\n'
+    '<td>{is_bidir}</td>\n'
+    '<td>{reverse_rel}</td>\n'
+    '<td>{reverse_count}</td>\n'
+    '<td>{discrepancy}</td>\n'
+    '</tr>\n'
+)
+
+
+# Per-type results keyed by type name, in display order
+SortedResults = Dict[str, List[PropertyValidationResult]]
+
+
+def _entity_sort_key(result: PropertyValidationResult) -> Tuple[bool, str]:
+    """Required properties first, then by category (EMPTY, PARTIAL, FULL)."""
+    return (not result.is_required, _CAT_VALUE[result.category])
+
+
+def _relationship_sort_key(result: PropertyValidationResult) -> str:
+    """Relationship properties by category (EMPTY, PARTIAL, FULL)."""
+    return _CAT_VALUE[result.category]
+
+
+@dataclass
+class ReportContext:
+    """Sorted results and summary shared by every report format."""
+    entity_results: SortedResults
+    relationship_results: SortedResults
+    relationship_existence: Dict[str, RelationshipExistenceResult]
+    summary: Dict[str, Any]
+
+
+def prepare_report(report: ValidationReport) -> ReportContext:
+    """
+    Sort results and build the summary once for every report format.
+    
+    Pass the result to generate_console_report and generate_html_report so
+    the same lists are not re-sorted and the summary is not rebuilt per output.
+    
+    Args:
+        report: ValidationReport to prepare
+        
+    Returns:
+        ReportContext with each results dict keyed by type name in sorted
+        order and its results in display order
+    """
+    return ReportContext(
+        entity_results={
+            entity_type: sorted(report.entity_results[entity_type], key=_entity_sort_key)
+            for entity_type in sorted(report.entity_results)
+        },
+        relationship_results={
+            rel_type: sorted(report.relationship_results[rel_type], key=_relationship_sort_key)
+            for rel_type in sorted(report.relationship_results)
+        },
+        relationship_existence=dict(sorted(report.relationship_existence.items())),
+        summary=report._generate_summary()
+    )
+
+
+def generate_console_report(report: ValidationReport, context: Optional[ReportContext] = None) -> None:
     """
     Generate and print console report with colored output.
     
+    The report is assembled in memory and written to stdout in one call.
+    
     Args:
         report: ValidationReport to display
+        context: Output of prepare_report, computed if not given
     """
-    print(f"\n{Colors.BOLD}{'='*100}")
-    print(f"PROPERTY VALIDATION REPORT")
-    print(f"Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*100}{Colors.RESET}\n")
+    context = context or prepare_report(report)
+    summary = context.summary
+    
+    out = io.StringIO()
+    
+    print(f"\n{_BANNER_TOP}", file=out)
+    print(f"PROPERTY VALIDATION REPORT", file=out)
+    print(f"Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", file=out)
+    print(_BANNER_BOTTOM, file=out)
     
     # Summary
-    summary = report._generate_summary()
-    print(f"{Colors.BOLD}SUMMARY{Colors.RESET}")
-    print(f"  Entity Types: {summary['total_entity_types']}")
-    print(f"  Relationship Types: {summary['total_relationship_types']}")
-    print(f"  Relationship Existence Checks: {summary.get('total_relationship_existence_checks', 0)}")
-    print(f"  Total Properties: {summary['total_properties_validated']}")
-    print(f"  {Colors.GREEN}✓ Full Population (100%): {summary['full_population']}{Colors.RESET}")
-    print(f"  {Colors.YELLOW}⚠ Partial Population (1-99%): {summary['partial_population']}{Colors.RESET}")
-    print(f"  {Colors.RED}✗ Empty (0%): {summary['empty_population']}{Colors.RESET}")
+    print(f"{Colors.BOLD}SUMMARY{Colors.RESET}", file=out)
+    print(f"  Entity Types: {summary['total_entity_types']}", file=out)
+    print(f"  Relationship Types: {summary['total_relationship_types']}", file=out)
+    print(f"  Relationship Existence Checks: {summary.get('total_relationship_existence_checks', 0)}", file=out)
+    print(f"  Total Properties: {summary['total_properties_validated']}", file=out)
+    print(f"  {Colors.GREEN}✓ Full Population (100%): {summary['full_population']}{Colors.RESET}", file=out)
+    print(f"  {Colors.YELLOW}⚠ Partial Population (1-99%): {summary['partial_population']}{Colors.RESET}", file=out)
+    print(f"  {Colors.RED}✗ Empty (0%): {summary['empty_population']}{Colors.RESET}", file=out)
     if summary['failures'] > 0:
-        print(f"  {Colors.RED}{Colors.BOLD}❌ FAILURES (Required properties at 0%): {summary['failures']}{Colors.RESET}")
+        print(f"  {Colors.RED}{Colors.BOLD}❌ FAILURES (Required properties at 0%): {summary['failures']}{Colors.RESET}", file=out)
     else:
-        print(f"  {Colors.GREEN}✓ No failures{Colors.RESET}")
+        print(f"  {Colors.GREEN}✓ No failures{Colors.RESET}", file=out)
     
     # Relationship coverage summary
     if 'relationship_coverage' in summary:
         cov = summary['relationship_coverage']
-        print(f"\n{Colors.BOLD}RELATIONSHIP COVERAGE{Colors.RESET}")
-        print(f"  Expected: {cov['expected']}")
-        print(f"  Discovered: {cov['discovered']}")
-        print(f"  Coverage: {Colors.GREEN if cov['coverage_percentage'] >= 95 else Colors.YELLOW}{cov['coverage_percentage']:.1f}%{Colors.RESET}")
+        print(f"\n{Colors.BOLD}RELATIONSHIP COVERAGE{Colors.RESET}", file=out)
+        print(f"  Expected: {cov['expected']}", file=out)
+        print(f"  Discovered: {cov['discovered']}", file=out)
+        print(f"  Coverage: {Colors.GREEN if cov['coverage_percentage'] >= 95 else Colors.YELLOW}{cov['coverage_percentage']:.1f}%{Colors.RESET}", file=out)
         if cov['missing'] > 0:
-            print(f"  {Colors.RED}Missing: {cov['missing']}{Colors.RESET}")
+            print(f"  {Colors.RED}Missing: {cov['missing']}{Colors.RESET}", file=out)
         if cov['unexpected'] > 0:
-            print(f"  {Colors.YELLOW}Unexpected: {cov['unexpected']}{Colors.RESET}")
-    print()
+            print(f"  {Colors.YELLOW}Unexpected: {cov['unexpected']}{Colors.RESET}", file=out)
+    print(file=out)
     
     # Relationship Coverage Details
     if report.relationship_coverage:
-        _print_relationship_coverage(report.relationship_coverage)
+        _print_relationship_coverage(report.relationship_coverage, out)
     
     # Relationship Existence
     if report.relationship_existence:
-        _print_relationship_existence(report.relationship_existence)
+        _print_relationship_existence(context.relationship_existence, out)
     
     # Entity results
     if report.entity_results:
-        print(f"{Colors.BOLD}{'='*100}")
-        print(f"ENTITY PROPERTIES")
-        print(f"{'='*100}{Colors.RESET}\n")
+        print(_BANNER_TOP, file=out)
+        print(f"ENTITY PROPERTIES", file=out)
+        print(_BANNER_BOTTOM, file=out)
         
-        for entity_type in sorted(report.entity_results.keys()):
-            results = report.entity_results[entity_type]
-            _print_entity_table(entity_type, results)
+        for entity_type, results in context.entity_results.items():
+            _print_entity_table(entity_type, results, out)
     
     # Relationship results
     if report.relationship_results:
-        print(f"{Colors.BOLD}{'='*100}")
-        print(f"RELATIONSHIP PROPERTIES")
-        print(f"{'='*100}{Colors.RESET}\n")
+        print(_BANNER_TOP, file=out)
+        print(f"RELATIONSHIP PROPERTIES", file=out)
+        print(_BANNER_BOTTOM, file=out)
         
-        for rel_type in sorted(report.relationship_results.keys()):
-            results = report.relationship_results[rel_type]
-            _print_relationship_table(rel_type, results)
+        for rel_type, results in context.relationship_results.items():
+            _print_relationship_table(rel_type, results, out)
+    
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
-def _print_entity_table(entity_type: str, results: List[PropertyValidationResult]) -> None:
+def _print_entity_table(entity_type: str, results: List[PropertyValidationResult], out: TextIO) -> None:
     """Print a table for entity property validation results."""
-    print(f"{Colors.BOLD}{Colors.BLUE}{entity_type}{Colors.RESET}")
-    print(f"{'-'*100}")
+    print(f"{Colors.BOLD}{Colors.BLUE}{entity_type}{Colors.RESET}", file=out)
+    print(_SEP_DASH, file=out)
     
     # Header
     header = f"{'Property':<30} {'Required':<10} {'Total':<8} {'Populated':<10} {'Empty':<8} {'%':<8} {'Category':<10}"
-    print(header)
-    print(f"{'-'*100}")
-    
-    # Sort by required first, then by category (EMPTY, PARTIAL, FULL)
-    sorted_results = sorted(results, key=lambda r: (not r.is_required, r.category.value))
+    print(header, file=out)
+    print(_SEP_DASH, file=out)
     
-    for result in sorted_results:
-        req_str = "YES" if result.is_required else "no"
-        
+    for result in results:
         # Color code the category
-        if result.category == PopulationCategory.FULL:
-            category_str = f"{Colors.GREEN}FULL{Colors.RESET}"
-            pct_str = f"{Colors.GREEN}{result.population_percentage:6.2f}%{Colors.RESET}"
-        elif result.category == PopulationCategory.PARTIAL:
-            category_str = f"{Colors.YELLOW}PARTIAL{Colors.RESET}"
-            pct_str = f"{Colors.YELLOW}{result.population_percentage:6.2f}%{Colors.RESET}"
+        if result.is_required and result.category == PopulationCategory.EMPTY:
+            category_str = _CAT_EMPTY_REQUIRED_STR
         else:
-            category_str = f"{Colors.RED}EMPTY{Colors.RESET}"
-            pct_str = f"{Colors.RED}{result.population_percentage:6.2f}%{Colors.RESET}"
-            if result.is_required:
-                category_str = f"{Colors.RED}{Colors.BOLD}EMPTY ❌{Colors.RESET}"
+            category_str = _CAT_STRS[result.category]
         
-        row = f"{result.property_name:<30} {req_str:<10} {result.total_count:<8} {result.populated_count:<10} {result.empty_count:<8} {pct_str:<15} {category_str}"
-        print(row)
-    
-    print()
+        print(_ENTITY_ROW_FMT.format(
+            name=result.property_name,
+            req="YES" if result.is_required else "no",
+            total=result.total_count,
+            populated=result.populated_count,
+            empty=result.empty_count,
+            pct=f"{_CAT_COLOR[result.category]}{result.population_percentage:6.2f}{_PCT_SUFFIX}",
+            category=category_str
+        ), file=out)
+    
+    print(file=out)
 
-def _print_relationship_coverage(coverage) -> None:
+def _print_relationship_coverage(coverage, out: TextIO) -> None:
     """Print relationship coverage section."""
-    print(f"{Colors.BOLD}{'='*100}")
-    print(f"RELATIONSHIP COVERAGE DETAILS")
-    print(f"{'='*100}{Colors.RESET}\n")
+    print(_BANNER_TOP, file=out)
+    print(f"RELATIONSHIP COVERAGE DETAILS", file=out)
+    print(_BANNER_BOTTOM, file=out)
     
-    print(f"{Colors.BOLD}Expected: {coverage.expected_count} | Discovered: {coverage.discovered_count} | Coverage: {(coverage.discovered_count/coverage.expected_count*100):.1f}%{Colors.RESET}\n")
+    print(f"{Colors.BOLD}Expected: {coverage.expected_count} | Discovered: {coverage.discovered_count} | Coverage: {(coverage.discovered_count/coverage.expected_count*100):.1f}%{Colors.RESET}\n", file=out)
     
     if coverage.missing_relationships:
-        print(f"{Colors.RED}{Colors.BOLD}MISSING RELATIONSHIPS ({len(coverage.missing_relationships)}){Colors.RESET}")
-        print(f"{Colors.RED}These relationships are expected but not found in the database:{Colors.RESET}")
+        print(f"{Colors.RED}{Colors.BOLD}MISSING RELATIONSHIPS ({len(coverage.missing_relationships)}){Colors.RESET}", file=out)
+        print(f"{Colors.RED}These relationships are expected but not found in the database:{Colors.RESET}", file=out)
         for rel in coverage.missing_relationships:
-            print(f"  ✗ {rel}")
-        print()
+            print(f"  ✗ {rel}", file=out)
+        print(file=out)
     
     if coverage.unexpected_relationships:
-        print(f"{Colors.YELLOW}{Colors.BOLD}UNEXPECTED RELATIONSHIPS ({len(coverage.unexpected_relationships)}){Colors.RESET}")
-        print(f"{Colors.YELLOW}These relationships are in the database but not defined in db/models.py:{Colors.RESET}")
+        print(f"{Colors.YELLOW}{Colors.BOLD}UNEXPECTED RELATIONSHIPS ({len(coverage.unexpected_relationships)}){Colors.RESET}", file=out)
+        print(f"{Colors.YELLOW}These relationships are in the database but not defined in db/models.py:{Colors.RESET}", file=out)
         for rel in coverage.unexpected_relationships:
-            print(f"  ? {rel}")
-        print()
+            print(f"  ? {rel}", file=out)
+        print(file=out)
     
     if coverage.bidirectional_mismatches:
-        print(f"{Colors.RED}{Colors.BOLD}BIDIRECTIONAL MISMATCHES ({len(coverage.bidirectional_mismatches)}){Colors.RESET}")
-        print(f"{Colors.RED}These bidirectional relationships are missing their reverse:{Colors.RESET}")
+        print(f"{Colors.RED}{Colors.BOLD}BIDIRECTIONAL MISMATCHES ({len(coverage.bidirectional_mismatches)}){Colors.RESET}", file=out)
+        print(f"{Colors.RED}These bidirectional relationships are missing their reverse:{Colors.RESET}", file=out)
         for rel in coverage.bidirectional_mismatches:
-            print(f"  ⚠ {rel}")
-        print()
+            print(f"  ⚠ {rel}", file=out)
+        print(file=out)
     
     if not coverage.missing_relationships and not coverage.unexpected_relationships and not coverage.bidirectional_mismatches:
-        print(f"{Colors.GREEN}✓ All expected relationships are present and consistent{Colors.RESET}\n")
+        print(f"{Colors.GREEN}✓ All expected relationships are present and consistent{Colors.RESET}\n", file=out)
 
 
-def _print_relationship_existence(existence_dict) -> None:
-    """Print relationship existence section."""
-    print(f"{Colors.BOLD}{'='*100}")
-    print(f"RELATIONSHIP EXISTENCE & CONSISTENCY")
-    print(f"{'='*100}{Colors.RESET}\n")
+def _print_relationship_existence(existence_dict, out: TextIO) -> None:
+    """Print relationship existence section (existence_dict in relationship name order)."""
+    print(_BANNER_TOP, file=out)
+    print(f"RELATIONSHIP EXISTENCE & CONSISTENCY", file=out)
+    print(_BANNER_BOTTOM, file=out)
     
-    # Group by expected vs unexpected
-    expected = {k: v for k, v in existence_dict.items() if v.is_expected}
-    unexpected = {k: v for k, v in existence_dict.items() if not v.is_expected}
+    # Group by expected vs unexpected in one pass
+    expected, unexpected = [], []
+    for item in existence_dict.items():
+        (expected if item[1].is_expected else unexpected).append(item)
     
     # Expected relationships
     if expected:
-        print(f"{Colors.BOLD}EXPECTED RELATIONSHIPS ({len(expected)}){Colors.RESET}")
-        print(f"{'-'*100}")
+        print(f"{Colors.BOLD}EXPECTED RELATIONSHIPS ({len(expected)}){Colors.RESET}", file=out)
+        print(_SEP_DASH, file=out)
         header = f"{'Relationship':<25} {'Count':<10} {'Props':<8} {'Bidirectional':<15} {'Reverse':<25} {'Rev Count':<10} {'Diff':<10}"
-        print(header)
-        print(f"{'-'*100}")
+        print(header, file=out)
+        print(_SEP_DASH, file=out)
         
-        for rel_type in sorted(expected.keys()):
-            result = expected[rel_type]
-            
+        for rel_type, result in expected:
             # Format bidirectional
             if result.is_same_name_bidirectional:
-                bidir_str = f"{Colors.GREEN}Same name{Colors.RESET}"
+                bidir_str = _BIDIR_SAME
             elif result.is_bidirectional:
-                bidir_str = f"{Colors.BLUE}Yes{Colors.RESET}"
+                bidir_str = _BIDIR_YES
             else:
                 bidir_str = "No"
             
             # Format reverse info
-            reverse_str = result.reverse_rel_type or "-"
-            rev_count_str = str(result.reverse_count) if result.reverse_count is not None else "-"
+            reverse_str = result.reverse_rel_type or _DASH
+            rev_count_str = _DASH if result.reverse_count is None else str(result.reverse_count)
             
-            # Format discrepancy
-            if result.count_discrepancy is not None:
-                if result.count_discrepancy == 0:
-                    diff_str = f"{Colors.GREEN}0{Colors.RESET}"
-                elif result.count_discrepancy < 10:
-                    diff_str = f"{Colors.YELLOW}{result.count_discrepancy}{Colors.RESET}"
-                else:
-                    diff_str = f"{Colors.RED}{result.count_discrepancy}{Colors.RESET}"
+            # Format discrepancy; only non-zero differences need building
+            discrepancy = result.count_discrepancy
+            if discrepancy is None:
+                diff_str = _DASH
+            elif discrepancy == 0:
+                diff_str = _DIFF_ZERO
+            elif discrepancy < 10:
+                diff_str = f"{Colors.YELLOW}{discrepancy}{Colors.RESET}"
             else:
-                diff_str = "-"
+                diff_str = f"{Colors.RED}{discrepancy}{Colors.RESET}"
             
             # Format props
-            props_str = f"{Colors.GREEN}Yes{Colors.RESET}" if result.has_properties else "No"
+            props_str = _PROPS_YES if result.has_properties else "No"
             
             row = f"{rel_type:<25} {result.total_count:<10} {props_str:<15} {bidir_str:<22} {reverse_str:<25} {rev_count_str:<10} {diff_str:<17}"
-            print(row)
-        print()
+            print(row, file=out)
+        print(file=out)
     
     # Unexpected relationships
     if unexpected:
-        print(f"{Colors.YELLOW}{Colors.BOLD}UNEXPECTED RELATIONSHIPS ({len(unexpected)}){Colors.RESET}")
-        print(f"{Colors.YELLOW}These are not defined in BIDIRECTIONAL_RELATIONSHIPS:{Colors.RESET}")
-        print(f"{'-'*100}")
-        for rel_type in sorted(unexpected.keys()):
-            result = unexpected[rel_type]
+        print(f"{Colors.YELLOW}{Colors.BOLD}UNEXPECTED RELATIONSHIPS ({len(unexpected)}){Colors.RESET}", file=out)
+        print(f"{Colors.YELLOW}These are not defined in BIDIRECTIONAL_RELATIONSHIPS:{Colors.RESET}", file=out)
+        print(_SEP_DASH, file=out)
+        for rel_type, result in unexpected:
             props_str = "with properties" if result.has_properties else "no properties"
-            print(f"  ? {rel_type:<30} Count: {result.total_count:<10} ({props_str})")
-        print()
+            print(f"  ? {rel_type:<30} Count: {result.total_count:<10} ({props_str})", file=out)
+        print(file=out)
 
-def _print_relationship_table(rel_type: str, results: List[PropertyValidationResult]) -> None:
+def _print_relationship_table(rel_type: str, results: List[PropertyValidationResult], out: TextIO) -> None:
     """Print a table for relationship property validation results."""
-    print(f"{Colors.BOLD}{Colors.BLUE}{rel_type}{Colors.RESET}")
-    print(f"{'-'*100}")
+    print(f"{Colors.BOLD}{Colors.BLUE}{rel_type}{Colors.RESET}", file=out)
+    print(_SEP_DASH, file=out)
     
     # Header (no "Required" column for relationships)
     header = f"{'Property':<30} {'Total':<8} {'Populated':<10} {'Empty':<8} {'%':<8} {'Category':<10}"
-    print(header)
-    print(f"{'-'*100}")
+    print(header, file=out)
+    print(_SEP_DASH, file=out)
     
-    # Sort by category
-    sorted_results = sorted(results, key=lambda r: r.category.value)
-    
-    for result in sorted_results:
+    for result in results:
         # Color code the category
-        if result.category == PopulationCategory.FULL:
-            category_str = f"{Colors.GREEN}FULL{Colors.RESET}"
-            pct_str = f"{Colors.GREEN}{result.population_percentage:6.2f}%{Colors.RESET}"
-        elif result.category == PopulationCategory.PARTIAL:
-            category_str = f"{Colors.YELLOW}PARTIAL{Colors.RESET}"
-            pct_str = f"{Colors.YELLOW}{result.population_percentage:6.2f}%{Colors.RESET}"
-        else:
-            category_str = f"{Colors.RED}EMPTY{Colors.RESET}"
-            pct_str = f"{Colors.RED}{result.population_percentage:6.2f}%{Colors.RESET}"
-        
-        row = f"{result.property_name:<30} {result.total_count:<8} {result.populated_count:<10} {result.empty_count:<8} {pct_str:<15} {category_str}"
-        print(row)
-    
-    print()
+        print(_RELATIONSHIP_ROW_FMT.format(
+            name=result.property_name,
+            total=result.total_count,
+            populated=result.populated_count,
+            empty=result.empty_count,
+            pct=f"{_CAT_COLOR[result.category]}{result.population_percentage:6.2f}{_PCT_SUFFIX}",
+            category=_CAT_STRS[result.category]
+        ), file=out)
+    
+    print(file=out)
 
 
-def generate_json_report(report: ValidationReport, output_path: Path) -> None:
+def generate_json_report(
+    report: ValidationReport,
+    output_path: Path,
+    summary: Optional[Dict[str, Any]] = None,
+    pretty: bool = False
+) -> None:
     """
     Generate JSON report file.
     
     Args:
         report: ValidationReport to save
-        output_path: Path to write JSON file
+        output_path: Path to write JSON file (gzip-compressed if it ends in .gz)
+        summary: Output of report._generate_summary(), computed if not given
+        pretty: Write indented JSON instead of compact JSON
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(report.to_dict(), f, indent=2)
+    report.write_json(output_path, summary, pretty)
     
-    print(f"{Colors.GREEN}✓ JSON report saved to: {output_path}{Colors.RESET}")
+    # One write per line so concurrent reports (generate_all_reports) don't interleave
+    sys.stdout.write(f"{Colors.GREEN}✓ JSON report saved to: {output_path}{Colors.RESET}\n")
 
 
-def generate_html_report(report: ValidationReport, output_path: Path) -> None:
+def generate_msgpack_report(report: ValidationReport, output_path: Path) -> None:
     """
-    Generate HTML report file with interactive tables.
+    Generate a MessagePack report file for programmatic consumers.
+    
+    Holds the same document as the JSON report (report.to_dict()) in a
+    smaller binary form that is faster to parse.
     
     Args:
         report: ValidationReport to save
-        output_path: Path to write HTML file
+        output_path: Path to write MessagePack file
+        
+    Raises:
+        ImportError: If the optional msgpack package is not installed
     """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if msgpack is None:
+        raise ImportError("generate_msgpack_report requires the msgpack package")
     
-    summary = report._generate_summary()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(msgpack.packb(report.to_dict(), use_bin_type=True))
     
-    html_content = f"""<!DOCTYPE html>
+    sys.stdout.write(f"{Colors.GREEN}✓ MessagePack report saved to: {output_path}{Colors.RESET}\n")
+
+
+# Static page head: styles and the opening <body>
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Property Validation Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background-color: white;
             padding: 30px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #333;
             border-bottom: 3px solid #4CAF50;
             padding-bottom: 10px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #555;
             margin-top: 30px;
             border-bottom: 2px solid #ddd;
             padding-bottom: 8px;
-        }}
-        .summary {{
+        }
+        .summary {
             background-color: #f9f9f9;
             padding: 20px;
             border-radius: 5px;
@@ -315,138 +491,141 @@ def generate_html_report(report: ValidationReport, output_path: Path) -> None:
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
-        }}
-        .summary-item {{
+        }
+        .summary-item {
             padding: 10px;
             border-left: 4px solid #4CAF50;
-        }}
-        .summary-item strong {{
+        }
+        .summary-item strong {
             display: block;
             font-size: 0.9em;
             color: #666;
-        }}
-        .summary-item .value {{
+        }
+        .summary-item .value {
             font-size: 1.8em;
             font-weight: bold;
             color: #333;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
             font-size: 0.95em;
-        }}
-        th {{
+        }
+        th {
             background-color: #4CAF50;
             color: white;
             padding: 12px;
             text-align: left;
             position: sticky;
             top: 0;
-        }}
-        td {{
+        }
+        td {
             padding: 10px;
             border-bottom: 1px solid #ddd;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f5f5f5;
-        }}
-        .entity-section {{
+        }
+        .entity-section {
             margin: 30px 0;
-        }}
-        .entity-name {{
+        }
+        .entity-name {
             font-size: 1.3em;
             font-weight: bold;
             color: #2196F3;
             margin: 15px 0 10px 0;
-        }}
-        .category-FULL {{
+        }
+        .category-FULL {
             background-color: #4CAF50;
             color: white;
             padding: 4px 8px;
             border-radius: 3px;
             font-weight: bold;
-        }}
-        .category-PARTIAL {{
+        }
+        .category-PARTIAL {
             background-color: #FF9800;
             color: white;
             padding: 4px 8px;
             border-radius: 3px;
             font-weight: bold;
-        }}
-        .category-EMPTY {{
+        }
+        .category-EMPTY {
             background-color: #f44336;
             color: white;
             padding: 4px 8px;
             border-radius: 3px;
             font-weight: bold;
-        }}
-        .required-yes {{
+        }
+        .required-yes {
             font-weight: bold;
             color: #d32f2f;
-        }}
-        .required-no {{
+        }
+        .required-no {
             color: #999;
-        }}
-        .failure-badge {{
+        }
+        .failure-badge {
             background-color: #f44336;
             color: white;
             padding: 2px 6px;
             border-radius: 3px;
             margin-left: 5px;
             font-size: 0.85em;
-        }}
-        .timestamp {{
+        }
+        .timestamp {
             color: #999;
             font-size: 0.9em;
-        }}
-        .search-box {{
+        }
+        .search-box {
             margin: 20px 0;
             padding: 10px;
             width: 100%;
             font-size: 1em;
             border: 2px solid #ddd;
             border-radius: 4px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="container">
+"""
+
+# Report header and summary cards, filled with str.format_map
+_HTML_SUMMARY_TEMPLATE = """    <div class="container">
         <h1>Property Validation Report</h1>
-        <p class="timestamp">Generated: {report.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p class="timestamp">Generated: {timestamp}</p>
         
         <div class="summary">
             <div class="summary-item">
                 <strong>Entity Types</strong>
-                <div class="value">{summary['total_entity_types']}</div>
+                <div class="value">{summary[total_entity_types]}</div>
             </div>
             <div class="summary-item">
                 <strong>Relationship Types (with properties)</strong>
-                <div class="value">{summary['total_relationship_types']}</div>
+                <div class="value">{summary[total_relationship_types]}</div>
             </div>
             <div class="summary-item">
                 <strong>Relationship Existence Checks</strong>
-                <div class="value">{summary.get('total_relationship_existence_checks', 0)}</div>
+                <div class="value">{existence_checks}</div>
             </div>
             <div class="summary-item">
                 <strong>Total Properties</strong>
-                <div class="value">{summary['total_properties_validated']}</div>
+                <div class="value">{summary[total_properties_validated]}</div>
             </div>
             <div class="summary-item" style="border-left-color: #4CAF50;">
                 <strong>Full Population</strong>
-                <div class="value" style="color: #4CAF50;">{summary['full_population']}</div>
+                <div class="value" style="color: #4CAF50;">{summary[full_population]}</div>
             </div>
             <div class="summary-item" style="border-left-color: #FF9800;">
                 <strong>Partial Population</strong>
-                <div class="value" style="color: #FF9800;">{summary['partial_population']}</div>
+                <div class="value" style="color: #FF9800;">{summary[partial_population]}</div>
             </div>
             <div class="summary-item" style="border-left-color: #f44336;">
                 <strong>Empty</strong>
-                <div class="value" style="color: #f44336;">{summary['empty_population']}</div>
+                <div class="value" style="color: #f44336;">{summary[empty_population]}</div>
             </div>
-            <div class="summary-item" style="border-left-color: {'#f44336' if summary['failures'] > 0 else '#4CAF50'};">
+            <div class="summary-item" style="border-left-color: {failure_color};">
                 <strong>Failures</strong>
-                <div class="value" style="color: {'#f44336' if summary['failures'] > 0 else '#4CAF50'};">{summary['failures']}</div>
+                <div class="value" style="color: {failure_color};">{summary[failures]}</div>
             </div>
         </div>
         
@@ -454,30 +633,9 @@ def generate_html_report(report: ValidationReport, output_path: Path) -> None:
         
         <h2>Entity Properties</h2>
 """
-    
-    # Add entity tables
-    for entity_type in sorted(report.entity_results.keys()):
-        results = report.entity_results[entity_type]
-        html_content += _generate_entity_table_html(entity_type, results)
-    
-    # Add relationship existence table
-    if report.relationship_existence:
-        html_content += "<h2>Relationship Existence (All 32 Relationships)</h2>\n"
-        html_content += _generate_relationship_existence_html(report.relationship_existence)
-    
-    # Add relationship coverage
-    if report.relationship_coverage:
-        html_content += "<h2>Relationship Coverage</h2>\n"
-        html_content += _generate_relationship_coverage_html(report.relationship_coverage)
-    
-    # Add relationship tables
-    html_content += "<h2>Relationship Properties (5 with properties)</h2>\n"
-    for rel_type in sorted(report.relationship_results.keys()):
-        results = report.relationship_results[rel_type]
-        html_content += _generate_relationship_table_html(rel_type, results)
-    
-    # Add JavaScript for search
-    html_content += """
+
+# Search script and closing tags
+_HTML_TAIL = """
         <script>
             function searchTable() {
                 const input = document.getElementById('searchBox');
@@ -485,14 +643,16 @@ def generate_html_report(report: ValidationReport, output_path: Path) -> None:
                 const sections = document.getElementsByClassName('entity-section');
                 
                 for (let section of sections) {
-                    const entityName = section.querySelector('.entity-name').textContent.toLowerCase();
+                    const nameElement = section.querySelector('.entity-name');
+                    const entityName = nameElement ? nameElement.textContent.toLowerCase() : '';
                     const table = section.querySelector('table');
+                    if (!table) continue;
                     const rows = table.getElementsByTagName('tr');
                     let sectionHasMatch = false;
                     
                     for (let i = 1; i < rows.length; i++) {
                         const row = rows[i];
-                        const text = row.textContent.toLowerCase();
+                        const text = row.dataset.search ?? row.textContent.toLowerCase();
                         
                         if (text.includes(filter) || entityName.includes(filter)) {
                             row.style.display = '';
@@ -510,155 +670,215 @@ def generate_html_report(report: ValidationReport, output_path: Path) -> None:
 </body>
 </html>
 """
+
+
+def generate_html_report(
+    report: ValidationReport,
+    output_path: Path,
+    context: Optional[ReportContext] = None
+) -> None:
+    """
+    Generate HTML report file with interactive tables.
     
-    with open(output_path, 'w') as f:
-        f.write(html_content)
+    Args:
+        report: ValidationReport to save
+        output_path: Path to write HTML file (gzip-compressed if it ends in .gz)
+        context: Output of prepare_report, computed if not given
+    """
+    context = context or prepare_report(report)
+    summary = context.summary
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    out = io.StringIO()
+    
+    out.write(_HTML_HEAD)
+    out.write(_HTML_SUMMARY_TEMPLATE.format_map({
+        "timestamp": report.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+        "summary": summary,
+        "existence_checks": summary.get('total_relationship_existence_checks', 0),
+        "failure_color": '#f44336' if summary['failures'] > 0 else '#4CAF50',
+    }))
+    
+    # Add entity tables
+    for entity_type, results in context.entity_results.items():
+        _generate_entity_table_html(entity_type, results, out)
+    
+    # Add relationship existence table
+    if report.relationship_existence:
+        out.write("<h2>Relationship Existence (All 32 Relationships)</h2>\n")
+        _generate_relationship_existence_html(context.relationship_existence, out)
+    
+    # Add relationship coverage
+    if report.relationship_coverage:
+        out.write("<h2>Relationship Coverage</h2>\n")
+        _generate_relationship_coverage_html(report.relationship_coverage, out)
+    
+    # Add relationship tables
+    out.write("<h2>Relationship Properties (5 with properties)</h2>\n")
+    for rel_type, results in context.relationship_results.items():
+        _generate_relationship_table_html(rel_type, results, out)
     
-    print(f"{Colors.GREEN}✓ HTML report saved to: {output_path}{Colors.RESET}")
+    # Add JavaScript for search
+    out.write(_HTML_TAIL)
+    
+    with open_report_file(output_path) as f:
+        f.write(out.getvalue())
+    
+    sys.stdout.write(f"{Colors.GREEN}✓ HTML report saved to: {output_path}{Colors.RESET}\n")
 
 
-def _generate_entity_table_html(entity_type: str, results: List[PropertyValidationResult]) -> str:
+def _generate_entity_table_html(entity_type: str, results: List[PropertyValidationResult], out: TextIO) -> None:
     """Generate HTML table for entity properties."""
-    html = f'<div class="entity-section">\n'
-    html += f'<div class="entity-name">{entity_type}</div>\n'
-    html += '<table>\n<thead>\n<tr>\n'
-    html += '<th>Property</th><th>Required</th><th>Total</th><th>Populated</th><th>Empty</th><th>%</th><th>Category</th>\n'
-    html += '</tr>\n</thead>\n<tbody>\n'
-    
-    sorted_results = sorted(results, key=lambda r: (not r.is_required, r.category.value))
-    
-    for result in sorted_results:
-        req_class = 'required-yes' if result.is_required else 'required-no'
-        req_text = 'YES' if result.is_required else 'no'
-        failure_badge = '<span class="failure-badge">FAILURE</span>' if result.is_required and result.category == PopulationCategory.EMPTY else ''
-        
-        html += '<tr>\n'
-        html += f'<td>{result.property_name}{failure_badge}</td>\n'
-        html += f'<td class="{req_class}">{req_text}</td>\n'
-        html += f'<td>{result.total_count}</td>\n'
-        html += f'<td>{result.populated_count}</td>\n'
-        html += f'<td>{result.empty_count}</td>\n'
-        html += f'<td>{result.population_percentage:.2f}%</td>\n'
-        html += f'<td><span class="category-{result.category.value}">{result.category.value}</span></td>\n'
-        html += '</tr>\n'
-    
-    html += '</tbody>\n</table>\n</div>\n'
-    return html
+    out.write(f'<div class="entity-section">\n<div class="entity-name">{_esc(entity_type)}</div>\n')
+    out.write(_HTML_ENTITY_THEAD)
+    
+    out.write(''.join([
+        _HTML_ENTITY_ROW.format(
+            search=_esc(f"{result.property_name} {'yes' if result.is_required else 'no'} {_CAT_VALUE[result.category]}".lower()),
+            name=_esc(result.property_name),
+            badge='<span class="failure-badge">FAILURE</span>' if result.is_required and result.category == PopulationCategory.EMPTY else '',
+            req_class='required-yes' if result.is_required else 'required-no',
+            req_text='YES' if result.is_required else 'no',
+            total=result.total_count,
+            populated=result.populated_count,
+            empty=result.empty_count,
+            pct=result.population_percentage,
+            category=_CAT_VALUE[result.category]
+        )
+        for result in results
+    ]))
+    
+    out.write(_HTML_TABLE_END)
 
 
-def _generate_relationship_table_html(rel_type: str, results: List[PropertyValidationResult]) -> str:
+def _generate_relationship_table_html(rel_type: str, results: List[PropertyValidationResult], out: TextIO) -> None:
     """Generate HTML table for relationship properties."""
-    html = f'<div class="entity-section">\n'
-    html += f'<div class="entity-name">{rel_type}</div>\n'
-    html += '<table>\n<thead>\n<tr>\n'
-    html += '<th>Property</th><th>Total</th><th>Populated</th><th>Empty</th><th>%</th><th>Category</th>\n'
-    html += '</tr>\n</thead>\n<tbody>\n'
-    
-    sorted_results = sorted(results, key=lambda r: r.category.value)
-    
-    for result in sorted_results:
-        html += '<tr>\n'
-        html += f'<td>{result.property_name}</td>\n'
-        html += f'<td>{result.total_count}</td>\n'
-        html += f'<td>{result.populated_count}</td>\n'
-        html += f'<td>{result.empty_count}</td>\n'
-        html += f'<td>{result.population_percentage:.2f}%</td>\n'
-        html += f'<td><span class="category-{result.category.value}">{result.category.value}</span></td>\n'
-        html += '</tr>\n'
-    
-    html += '</tbody>\n</table>\n</div>\n'
-    return html
-
-
-def _generate_relationship_existence_html(relationship_existence: dict) -> str:
-    """Generate HTML table for relationship existence with counts and bidirectional checking."""
-    html = '<div class="entity-section">\n'
-    html += '<table>\n<thead>\n<tr>\n'
-    html += '<th>Relationship</th><th>Count</th><th>Has Properties</th><th>Expected</th>'
-    html += '<th>Bidirectional</th><th>Reverse Rel</th><th>Reverse Count</th><th>Discrepancy</th>\n'
-    html += '</tr>\n</thead>\n<tbody>\n'
-    
-    # Sort by relationship name
-    for rel_type in sorted(relationship_existence.keys()):
-        result = relationship_existence[rel_type]
-        
-        # Color code based on expected/unexpected
-        row_class = '' if result.is_expected else 'style="background-color: #fff3cd;"'
-        
-        has_props = '✓' if result.has_properties else '—'
-        is_expected = '✓' if result.is_expected else '✗ UNEXPECTED'
-        is_bidir = '✓' if result.is_bidirectional else '—'
-        
-        reverse_rel = result.reverse_rel_type or '—'
-        reverse_count = result.reverse_count
-        if reverse_count is not None:
-            reverse_count = str(reverse_count)
-        else:
-            reverse_count = '—'
-        
-        discrepancy = result.count_discrepancy
-        if discrepancy is not None:
-            if discrepancy == 0:
-                discrepancy = '✓ Perfect'
-            else:
-                discrepancy = f'⚠️ {discrepancy}'
-        else:
-            discrepancy = '—'
-        
-        html += f'<tr {row_class}>\n'
-        html += f'<td><strong>{result.rel_type}</strong></td>\n'
-        html += f'<td>{result.total_count}</td>\n'
-        html += f'<td>{has_props}</td>\n'
-        html += f'<td>{is_expected}</td>\n'
-        html += f'<td>{is_bidir}</td>\n'
-        html += f'<td>{reverse_rel}</td>\n'
-        html += f'<td>{reverse_count}</td>\n'
-        html += f'<td>{discrepancy}</td>\n'
-        html += '</tr>\n'
-    
-    html += '</tbody>\n</table>\n</div>\n'
-    return html
-
-
-def _generate_relationship_coverage_html(coverage: 'RelationshipCoverageResult') -> str:
+    out.write(f'<div class="entity-section">\n<div class="entity-name">{_esc(rel_type)}</div>\n')
+    out.write(_HTML_RELATIONSHIP_THEAD)
+    
+    out.write(''.join([
+        _HTML_RELATIONSHIP_ROW.format(
+            search=_esc(f"{result.property_name} {_CAT_VALUE[result.category]}".lower()),
+            name=_esc(result.property_name),
+            total=result.total_count,
+            populated=result.populated_count,
+            empty=result.empty_count,
+            pct=result.population_percentage,
+            category=_CAT_VALUE[result.category]
+        )
+        for result in results
+    ]))
+    
+    out.write(_HTML_TABLE_END)
+
+
+def _html_discrepancy(discrepancy: Optional[int]) -> str:
+    """Format a bidirectional count discrepancy for the HTML existence table."""
+    if discrepancy is None:
+        return _HTML_DASH
+    return '✓ Perfect' if discrepancy == 0 else f'⚠️ {discrepancy}'
+
+
+def _generate_relationship_existence_html(relationship_existence: dict, out: TextIO) -> None:
+    """Generate HTML table for relationship existence (in relationship name order) with counts and bidirectional checking."""
+    out.write('<div class="entity-section">\n')
+    out.write(_HTML_EXISTENCE_THEAD)
+    
+    results = list(relationship_existence.values())
+    
+    # Build each column in one pass, then zip the columns into rows
+    row_classes = ['' if r.is_expected else _HTML_UNEXPECTED_ROW for r in results]
+    rel_types = [_esc(r.rel_type) for r in results]
+    counts = [r.total_count for r in results]
+    has_props = [_HTML_CHECK if r.has_properties else _HTML_DASH for r in results]
+    is_expected = [_HTML_CHECK if r.is_expected else '✗ UNEXPECTED' for r in results]
+    is_bidir = [_HTML_CHECK if r.is_bidirectional else _HTML_DASH for r in results]
+    reverse_rels = [_esc(r.reverse_rel_type) if r.reverse_rel_type else _HTML_DASH for r in results]
+    reverse_counts = [_HTML_DASH if r.reverse_count is None else str(r.reverse_count) for r in results]
+    discrepancies = [_html_discrepancy(r.count_discrepancy) for r in results]
+    
+    out.write(''.join([
+        _HTML_EXISTENCE_ROW.format(
+            row_class=row_class,
+            rel_type=rel_type,
+            total=count,
+            has_props=props,
+            is_expected=expected,
+            is_bidir=bidir,
+            reverse_rel=reverse_rel,
+            reverse_count=reverse_count,
+            discrepancy=discrepancy
+        )
+        for row_class, rel_type, count, props, expected, bidir, reverse_rel, reverse_count, discrepancy in zip(
+            row_classes, rel_types, counts, has_props, is_expected, is_bidir, reverse_rels, reverse_counts, discrepancies
+        )
+    ]))
+    out.write(_HTML_TABLE_END)
+
+
+def _generate_relationship_coverage_html(coverage: 'RelationshipCoverageResult', out: TextIO) -> None:
     """Generate HTML for relationship coverage summary."""
-    html = '<div class="entity-section">\n'
+    out.write('<div class="entity-section">\n')
     
     # Calculate coverage percentage
     coverage_pct = (coverage.discovered_count / coverage.expected_count * 100) if coverage.expected_count > 0 else 0.0
     
-    html += f'<p><strong>Expected:</strong> {coverage.expected_count} | '
-    html += f'<strong>Discovered:</strong> {coverage.discovered_count} | '
-    html += f'<strong>Coverage:</strong> {coverage_pct:.1f}%</p>\n'
+    out.write(f'<p><strong>Expected:</strong> {coverage.expected_count} | ')
+    out.write(f'<strong>Discovered:</strong> {coverage.discovered_count} | ')
+    out.write(f'<strong>Coverage:</strong> {coverage_pct:.1f}%</p>\n')
     
     if coverage.missing_relationships:
-        html += '<div style="background-color: #ffebee; padding: 15px; border-radius: 5px; margin: 10px 0;">\n'
-        html += f'<h3 style="color: #c62828; margin-top: 0;">Missing Relationships ({len(coverage.missing_relationships)})</h3>\n'
-        html += '<ul>\n'
+        out.write('<div style="background-color: #ffebee; padding: 15px; border-radius: 5px; margin: 10px 0;">\n')
+        out.write(f'<h3 style="color: #c62828; margin-top: 0;">Missing Relationships ({len(coverage.missing_relationships)})</h3>\n')
+        out.write('<ul>\n')
         for rel in coverage.missing_relationships:
-            html += f'<li><code>{rel}</code></li>\n'
-        html += '</ul>\n</div>\n'
+            out.write(f'<li><code>{_esc(rel)}</code></li>\n')
+        out.write('</ul>\n</div>\n')
     
     if coverage.unexpected_relationships:
-        html += '<div style="background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0;">\n'
-        html += f'<h3 style="color: #856404; margin-top: 0;">Unexpected Relationships ({len(coverage.unexpected_relationships)})</h3>\n'
-        html += '<ul>\n'
+        out.write('<div style="background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0;">\n')
+        out.write(f'<h3 style="color: #856404; margin-top: 0;">Unexpected Relationships ({len(coverage.unexpected_relationships)})</h3>\n')
+        out.write('<ul>\n')
         for rel in coverage.unexpected_relationships:
-            html += f'<li><code>{rel}</code></li>\n'
-        html += '</ul>\n</div>\n'
+            out.write(f'<li><code>{_esc(rel)}</code></li>\n')
+        out.write('</ul>\n</div>\n')
     
     if coverage.bidirectional_mismatches:
-        html += '<div style="background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0;">\n'
-        html += f'<h3 style="color: #856404; margin-top: 0;">Bidirectional Mismatches ({len(coverage.bidirectional_mismatches)})</h3>\n'
-        html += '<ul>\n'
+        out.write('<div style="background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0;">\n')
+        out.write(f'<h3 style="color: #856404; margin-top: 0;">Bidirectional Mismatches ({len(coverage.bidirectional_mismatches)})</h3>\n')
+        out.write('<ul>\n')
         for mismatch in coverage.bidirectional_mismatches:
-            html += f'<li>{mismatch}</li>\n'
-        html += '</ul>\n</div>\n'
+            out.write(f'<li>{_esc(mismatch)}</li>\n')
+        out.write('</ul>\n</div>\n')
     
     if not coverage.missing_relationships and not coverage.unexpected_relationships and not coverage.bidirectional_mismatches:
-        html += '<div style="background-color: #e8f5e9; padding: 15px; border-radius: 5px; margin: 10px 0;">\n'
-        html += '<p style="color: #2e7d32; margin: 0;"><strong>✓ All expected relationships present</strong></p>\n'
-        html += '</div>\n'
+        out.write('<div style="background-color: #e8f5e9; padding: 15px; border-radius: 5px; margin: 10px 0;">\n')
+        out.write('<p style="color: #2e7d32; margin: 0;"><strong>✓ All expected relationships present</strong></p>\n')
+        out.write('</div>\n')
     
-    html += '</div>\n'
-    return html
+    out.write('</div>\n')
+
+
+def generate_all_reports(report: ValidationReport, json_path: Path, html_path: Optional[Path]) -> None:
+    """
+    Generate the console, JSON and HTML reports concurrently.
+    
+    The outputs are independent and mostly I/O, so they run on separate
+    threads. Results are sorted and summarized once and shared by all three.
+    
+    Args:
+        report: ValidationReport to render
+        json_path: Path to write JSON file
+        html_path: Path to write HTML file, or None to skip the HTML report
+    """
+    context = prepare_report(report)
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(generate_console_report, report, context),
+            executor.submit(generate_json_report, report, json_path, context.summary),
+        ]
+        if html_path is not None:
+            futures.append(executor.submit(generate_html_report, report, html_path, context))
+        for future in futures:
+            future.result()
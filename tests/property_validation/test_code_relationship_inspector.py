@@ -0,0 +1,49 @@
+"""
+Unit tests for relationship categorization from BIDIRECTIONAL_RELATIONSHIPS.
+
+These tests do not need a Neo4j connection.
+"""
+
+import pytest
+
+from tests.property_validation import code_relationship_inspector
+
+
+@pytest.fixture
+def relationships(monkeypatch):
+    """Swap in a small relationship map and reset the categorization cache around the test."""
+    def use(mapping):
+        monkeypatch.setattr(code_relationship_inspector, "BIDIRECTIONAL_RELATIONSHIPS", mapping)
+        code_relationship_inspector.categorize_relationships.cache_clear()
+    
+    yield use
+    code_relationship_inspector.categorize_relationships.cache_clear()
+
+
+def test_unidirectional_relationships_are_categorized(relationships):
+    """A relationship whose reverse is None is unidirectional, not a different-name pair."""
+    relationships({"MEMBER_OF": "MEMBER_OF", "BLOCKS": "BLOCKED_BY", "OWNS": None})
+    
+    same_name, different_name, unidirectional = code_relationship_inspector.categorize_relationships()
+    
+    assert same_name == {"MEMBER_OF"}
+    assert dict(different_name) == {"BLOCKS": "BLOCKED_BY"}
+    assert unidirectional == {"OWNS"}
+
+
+def test_chained_pairs_are_all_kept(relationships):
+    """MANAGES is both the reverse of REPORTS_TO and a forward type; both pairs are kept."""
+    relationships({"REPORTS_TO": "MANAGES", "MANAGES": "MANAGED_BY"})
+    
+    _, different_name, _ = code_relationship_inspector.categorize_relationships()
+    
+    assert dict(different_name) == {"REPORTS_TO": "MANAGES", "MANAGES": "MANAGED_BY"}
+
+
+def test_mirrored_pair_is_recorded_once(relationships):
+    """A pair defined in both directions appears once."""
+    relationships({"BLOCKS": "BLOCKED_BY", "BLOCKED_BY": "BLOCKS"})
+    
+    _, different_name, _ = code_relationship_inspector.categorize_relationships()
+    
+    assert dict(different_name) == {"BLOCKS": "BLOCKED_BY"}
@@ -14,78 +14,77 @@ Environment variables required:
     NEO4J_URI - Neo4j connection URI (default: bolt://localhost:7687)
     NEO4J_USERNAME - Neo4j username (default: neo4j)
     NEO4J_PASSWORD - Neo4j password (required)
+    NEO4J_DATABASE - Database to validate (default: neo4j)
+    NEO4J_MAX_POOL_SIZE - Driver connection pool size (default: 64)
+    NEO4J_ACQUIRE_TIMEOUT - Seconds to wait for a pooled connection (default: 60)
+    PROPERTY_VALIDATION_CACHE - Set to 1 to reuse the last report while the graph is unchanged
+    CI_SMOKE - Set to 1 to skip the HTML report
 """
 
 import os
 import pytest
 from pathlib import Path
-from neo4j import GraphDatabase
+from types import SimpleNamespace
 
-from tests.property_validation.validator import PropertyValidator
-from tests.property_validation.report_generator import (
-    generate_console_report,
-    generate_json_report,
-    generate_html_report
-)
+from tests.property_validation.report_generator import generate_all_reports, generate_msgpack_report
 
+REPORT_DIR = Path(__file__).parent / "results"
+JSON_REPORT_PATH = REPORT_DIR / "report.json"
+HTML_REPORT_PATH = REPORT_DIR / "report.html"
+MSGPACK_REPORT_PATH = REPORT_DIR / "report.msgpack"
 
-@pytest.fixture(scope="module")
-def neo4j_driver():
-    """Create Neo4j driver for the test session."""
-    uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
-    username = os.getenv('NEO4J_USERNAME', 'neo4j')
-    password = os.getenv('NEO4J_PASSWORD')
-    
-    if not password:
-        pytest.skip("NEO4J_PASSWORD environment variable not set")
-    
-    driver = GraphDatabase.driver(uri, auth=(username, password))
-    
-    # Verify connection
-    try:
-        driver.verify_connectivity()
-    except Exception as e:
-        pytest.skip(f"Could not connect to Neo4j: {e}")
-    
-    yield driver
-    
-    driver.close()
+# Smoke runs only consume the console and JSON output
+SMOKE_MODE = os.getenv("CI_SMOKE") == "1"
 
 
 @pytest.fixture(scope="module")
-def validation_report(neo4j_driver):
-    """Run validation once and reuse the report for all tests."""
-    with neo4j_driver.session() as session:
-        validator = PropertyValidator(session)
-        report = validator.validate_all()
-        return report
-
-
-def test_validate_all_properties(validation_report):
+def classified(validation_report):
     """
-    Validate that all required properties are populated in at least some nodes.
-    
-    This test fails if ANY required property has 0% population across all nodes.
+    Required-property failures and partial-population warnings, plus the
+    report summary, gathered in one pass over the entity results.
     """
     failures = []
-    
-    # Check entity properties
+    warnings = []
     for entity_type, results in validation_report.entity_results.items():
         for result in results:
-            if result.is_required and result.population_percentage == 0.0:
+            if not result.is_required:
+                continue
+            if result.population_percentage == 0.0:
                 failures.append(
-                    f"{entity_type}.{result.property_name}: REQUIRED property is empty in all {result.total_count} nodes"
+                    f"{entity_type}.{result.property_name}: REQUIRED property is empty in all {result.total_count}"
+                    f"{' sampled' if result.sampled else ''} nodes"
+                )
+            elif result.population_percentage < 100.0:
+                warnings.append(
+                    f"{entity_type}.{result.property_name}: "
+                    f"{result.population_percentage:.1f}% populated "
+                    f"({result.empty_count}/{result.total_count} nodes missing)"
                 )
     
+    return SimpleNamespace(
+        failures=failures,
+        warnings=warnings,
+        summary=validation_report._generate_summary()
+    )
+
+
+def test_validate_all_properties(classified):
+    """
+    Validate that all required properties are populated in at least some nodes.
+    
+    This test fails if ANY required property has 0% population across all nodes.
+    """
+    failures = classified.failures
+    
     # Build failure message
     if failures:
-        failure_msg = f"\n\n{len(failures)} required properties are completely empty:\n"
-        for failure in failures:
-            failure_msg += f"  ❌ {failure}\n"
-        pytest.fail(failure_msg)
+        pytest.fail(
+            f"\n\n{len(failures)} required properties are completely empty:\n"
+            + "".join(f"  ❌ {failure}\n" for failure in failures)
+        )
     
     # If no failures, report success
-    summary = validation_report._generate_summary()
+    summary = classified.summary
     print(f"\n✓ All required properties have at least some population")
     print(f"  Total properties validated: {summary['total_properties_validated']}")
     print(f"  Full population: {summary['full_population']}")
@@ -95,38 +94,44 @@ def test_validate_all_properties(validation_report):
 
 def test_generate_reports(validation_report):
     """
-    Generate console, JSON, and HTML reports.
+    Generate console, JSON, and HTML reports (HTML is skipped when CI_SMOKE=1).
     """
-    # Console report
     print("\n" + "="*100)
     print("GENERATING REPORTS")
     print("="*100)
-    generate_console_report(validation_report)
-    
-    # JSON report
-    report_dir = Path(__file__).parent / "results"
-    report_dir.mkdir(exist_ok=True)
-    json_path = report_dir / "report.json"
-    generate_json_report(validation_report, json_path)
     
-    # HTML report
-    html_path = report_dir / "report.html"
-    generate_html_report(validation_report, html_path)
+    REPORT_DIR.mkdir(exist_ok=True)
+    generate_all_reports(validation_report, JSON_REPORT_PATH, None if SMOKE_MODE else HTML_REPORT_PATH)
     
     # Verify files were created
-    assert json_path.exists(), f"JSON report not created at {json_path}"
-    assert html_path.exists(), f"HTML report not created at {html_path}"
+    assert JSON_REPORT_PATH.exists(), f"JSON report not created at {JSON_REPORT_PATH}"
+    if not SMOKE_MODE:
+        assert HTML_REPORT_PATH.exists(), f"HTML report not created at {HTML_REPORT_PATH}"
     
     print(f"\n✓ All reports generated successfully")
 
 
-def test_no_entity_types_missed(validation_report):
+def test_generate_msgpack_report(validation_report):
+    """
+    Generate the binary MessagePack report for programmatic consumers.
+    """
+    msgpack = pytest.importorskip("msgpack")
+    
+    generate_msgpack_report(validation_report, MSGPACK_REPORT_PATH)
+    
+    assert MSGPACK_REPORT_PATH.exists(), f"MessagePack report not created at {MSGPACK_REPORT_PATH}"
+    data = msgpack.unpackb(MSGPACK_REPORT_PATH.read_bytes())
+    assert data["failure_count"] == validation_report.failure_count
+
+
+def test_no_entity_types_missed(entity_types):
     """
     Verify that we discovered a reasonable number of entity types.
     
-    This is a sanity check to ensure the model introspection is working.
+    This is a sanity check to ensure the model introspection is working;
+    it does not need Neo4j, so it fails fast without running validation.
     """
-    entity_count = len(validation_report.entity_results)
+    entity_count = len(entity_types)
     
     # We expect at least 10 entity types (Person, Team, Repository, Issue, etc.)
     assert entity_count >= 10, (
@@ -137,23 +142,14 @@ def test_no_entity_types_missed(validation_report):
     print(f"\n✓ Discovered {entity_count} entity types from db/models.py")
 
 
-def test_partial_population_warning(validation_report):
+def test_partial_population_warning(classified):
     """
     Warn about required properties with partial population.
     
     This test does not fail, but prints warnings for required properties
     that are not 100% populated.
     """
-    warnings = []
-    
-    for entity_type, results in validation_report.entity_results.items():
-        for result in results:
-            if result.is_required and 0 < result.population_percentage < 100.0:
-                warnings.append(
-                    f"{entity_type}.{result.property_name}: "
-                    f"{result.population_percentage:.1f}% populated "
-                    f"({result.empty_count}/{result.total_count} nodes missing)"
-                )
+    warnings = classified.warnings
     
     if warnings:
         print(f"\n⚠️  {len(warnings)} required properties have partial population:")
@@ -175,10 +171,10 @@ def test_all_expected_relationships_exist(validation_report):
     coverage = validation_report.relationship_coverage
     
     if coverage.missing_relationships:
-        failure_msg = f"\n\n{len(coverage.missing_relationships)} expected relationships are MISSING from the database:\n"
-        for rel in coverage.missing_relationships:
-            failure_msg += f"  ✗ {rel}\n"
-        pytest.fail(failure_msg)
+        pytest.fail(
+            f"\n\n{len(coverage.missing_relationships)} expected relationships are MISSING from the database:\n"
+            + "".join(f"  ✗ {rel}\n" for rel in coverage.missing_relationships)
+        )
     
     print(f"\n✓ All {coverage.expected_count} expected relationships exist in database")
 
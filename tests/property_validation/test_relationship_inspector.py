@@ -0,0 +1,50 @@
+"""
+Unit tests for sampled relationship property discovery.
+
+These tests do not need a Neo4j connection.
+"""
+
+from tests.property_validation.relationship_inspector import _discover_properties_for_types
+
+
+class FakeSession:
+    """
+    Answers the batched sampling query from a fixed type -> properties map.
+    
+    Like Cypher, a type with no properties produces no row, and a query that
+    mentions a type listed in failing raises.
+    """
+    
+    def __init__(self, properties, failing=()):
+        self.properties = properties
+        self.failing = set(failing)
+        self.queries = []
+    
+    def run(self, query, rel_types):
+        self.queries.append(rel_types)
+        if self.failing.intersection(rel_types):
+            raise RuntimeError("branch failed")
+        return [
+            {"rel_type": rel_type, "properties": self.properties[rel_type]}
+            for rel_type in rel_types
+            if self.properties[rel_type]
+        ]
+
+
+def test_types_without_properties_are_kept():
+    """A type whose relationships carry no properties maps to an empty list."""
+    session = FakeSession({"MEMBER_OF": [], "REVIEWED_BY": ["state", "submitted_at"]})
+    
+    properties = _discover_properties_for_types(session, ["MEMBER_OF", "REVIEWED_BY"])
+    
+    assert properties == {"MEMBER_OF": [], "REVIEWED_BY": ["state", "submitted_at"]}
+    assert session.queries == [["MEMBER_OF", "REVIEWED_BY"]]
+
+
+def test_failing_type_only_blanks_itself():
+    """When the batch fails, types are retried one by one and the others keep their properties."""
+    session = FakeSession({"BLOCKS": ["since"], "BROKEN": ["x"], "OWNS": ["role"]}, failing={"BROKEN"})
+    
+    properties = _discover_properties_for_types(session, ["BLOCKS", "BROKEN", "OWNS"])
+    
+    assert properties == {"BLOCKS": ["since"], "BROKEN": [], "OWNS": ["role"]}
@@ -0,0 +1,33 @@
+"""
+Unit tests for population categorization.
+
+These tests do not need a Neo4j connection.
+"""
+
+import pytest
+
+from tests.property_validation.models import PopulationCategory
+from tests.property_validation.validator import PropertyValidator
+
+
+@pytest.mark.parametrize("populated, total, category", [
+    (0, 0, PopulationCategory.EMPTY),
+    (0, 5, PopulationCategory.EMPTY),
+    (3, 5, PopulationCategory.PARTIAL),
+    (5, 5, PopulationCategory.FULL),
+])
+def test_categorize_result(populated, total, category):
+    """Categories follow from comparing the counts, including a type with no instances."""
+    validator = PropertyValidator(driver=None, database="neo4j")
+    
+    assert validator.categorize_result(populated, total) == category
+
+
+def test_property_result_uses_categorize_result():
+    """Results built from bulk query counts get the same category as categorize_result."""
+    validator = PropertyValidator(driver=None, database="neo4j")
+    
+    result = validator._property_result("email", "Person", 5, 3, 60.0, False, is_required=True)
+    
+    assert result.category == PopulationCategory.PARTIAL
+    assert result.empty_count == 2
@@ -2,9 +2,15 @@
 Execute property validation against Neo4j database.
 """
 
+import hashlib
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
-from neo4j import Session
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from neo4j import Driver, Record, RoutingControl
 
 from tests.property_validation.models import (
     PropertyValidationResult,
@@ -14,37 +20,186 @@ from tests.property_validation.models import (
     RelationshipExistenceResult,
     RelationshipCoverageResult
 )
+from tests.property_validation.connection import database_name
 from tests.property_validation.model_inspector import discover_entity_types
 from tests.property_validation.relationship_inspector import discover_all_relationships
 from tests.property_validation.code_relationship_inspector import (
+    DIFFERENT_NAME_REVERSES,
     get_all_relationship_names,
+    get_expected_relationships,
     get_relationship_pair,
     is_bidirectional,
     is_same_name_bidirectional
 )
 from tests.property_validation.query_generator import (
-    generate_node_property_query,
-    generate_relationship_property_query
+    generate_node_properties_bulk_query,
+    generate_relationship_properties_bulk_query,
+    generate_label_counts_query,
+    generate_relationship_counts_query
 )
 
 
+# (total, populated, percentage, sampled) for a property with no rows to count
+_NO_COUNTS = (0, 0, 0.0, False)
+
+# Nodes/relationships counted per type for sampled properties in fast mode
+FAST_MODE_SAMPLE_SIZE = 10000
+
+# Progress is logged at INFO (stages) and DEBUG (per type); under pytest,
+# show it live with --log-cli-level=INFO
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    """
+    Print progress to stdout when this module runs as a script.
+    
+    The level comes from PROPERTY_VALIDATION_LOG_LEVEL (default INFO);
+    an unrecognised value falls back to INFO with a warning.
+    """
+    level_name = os.getenv("PROPERTY_VALIDATION_LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(stream=sys.stdout, format="%(levelname)s %(message)s")
+    if not isinstance(level, int):
+        logger.warning("Unknown PROPERTY_VALIDATION_LOG_LEVEL '%s', using INFO", level_name)
+        level = logging.INFO
+    # Run as a script this module's logger is "__main__", outside the package hierarchy
+    for name in (__name__, __package__ or "tests.property_validation"):
+        logging.getLogger(name).setLevel(level)
+
+
 class PropertyValidator:
     """Validates property population across Neo4j nodes and relationships."""
     
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        driver: Driver,
+        max_workers: int = 8,
+        database: Optional[str] = None,
+        fast_mode: Optional[bool] = None,
+        row_cap: Optional[int] = None
+    ):
         """
         Initialize the validator.
         
         Args:
-            session: Neo4j session to use for queries
+            driver: Neo4j driver; each query is a separate pooled read,
+                    so validations can run on several threads at once
+            max_workers: Number of entity/relationship types validated concurrently
+            database: Database to query (default: NEO4J_DATABASE or "neo4j")
+            fast_mode: Count optional properties over the first FAST_MODE_SAMPLE_SIZE
+                       nodes/relationships of each type instead of all of them;
+                       required properties are always counted exactly
+                       (default: VALIDATION_FAST=1)
+            row_cap: Count every property over at most this many nodes/relationships
+                     per type, bounding each scan on very large graphs
+                     (default: VALIDATION_ROW_CAP, unset for no cap)
         """
-        self.session = session
-        self.entity_metadata: Dict[str, EntityMetadata] = {}
+        self.driver = driver
+        self.max_workers = max_workers
+        self.database = database or database_name()
+        self.fast_mode = os.getenv("VALIDATION_FAST") == "1" if fast_mode is None else fast_mode
+        if row_cap is None and os.getenv("VALIDATION_ROW_CAP"):
+            row_cap = int(os.environ["VALIDATION_ROW_CAP"])
+        self.row_cap = row_cap
+        self.entity_metadata: Mapping[str, EntityMetadata] = {}
         self.relationship_metadata: Dict[str, List[str]] = {}
+        # Counts loaded up front by load_counts(); used to skip work for empty types
+        self.label_counts: Dict[str, int] = {}
+        self.relationship_counts: Dict[str, int] = {}
+    
+    def _run(self, query: str, **parameters: Any) -> List[Record]:
+        """
+        Run a read query and return all records.
+        
+        Driver.execute_query pipelines BEGIN/RUN/PULL into one round-trip and
+        retries transient errors. Queries are read-only, so no bookmarks are
+        shared between the worker threads.
+        """
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters,
+            routing_=RoutingControl.READ,
+            database_=self.database,
+            bookmark_manager_=None
+        )
+        return records
+    
+    def _run_counts_query(self, query: str, names: List[str]) -> Dict[str, int]:
+        """Run a label/relationship counts query and index totals by name."""
+        if not names:
+            return {}
+        return {record["name"]: record["total"] for record in self._run(query, names=names)}
+    
+    def graph_fingerprint(self, relationship_metadata: Dict[str, List[str]]) -> str:
+        """
+        Fingerprint the inputs of a validation run, for reusing a cached report.
+        
+        Covers the database name, the sampling settings, total node and
+        relationship counts (read from the count store), the discovered
+        relationship properties, and the entity properties and expected
+        relationships in db/models.py. Edits that leave every count
+        unchanged are not detected.
+        
+        Args:
+            relationship_metadata: Discovered relationship types and properties
+            
+        Returns:
+            Hex digest identifying the graph and model state
+        """
+        records = self._run(
+            "CALL { MATCH (n) RETURN count(n) as nodes } "
+            "CALL { MATCH ()-[r]->() RETURN count(r) as relationships } "
+            "RETURN nodes, relationships"
+        )
+        entity_properties = {
+            entity_name: [(prop.name, prop.is_optional) for prop in metadata.properties]
+            for entity_name, metadata in discover_entity_types().items()
+        }
+        # Coverage and existence results depend on the expected relationships
+        expected_relationships = [
+            get_expected_relationships(),
+            sorted(get_all_relationship_names()),
+            dict(DIFFERENT_NAME_REVERSES),
+        ]
+        state = [
+            self.database,
+            [self.fast_mode, self.row_cap],
+            [records[0]["nodes"], records[0]["relationships"]],
+            relationship_metadata,
+            entity_properties,
+            expected_relationships,
+        ]
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode("utf-8")).hexdigest()
+    
+    def load_counts(self, labels: List[str], rel_types: List[str]) -> None:
+        """
+        Fetch node counts per label and relationship counts per type in two queries.
+        
+        Property queries for labels/types with zero instances are then skipped,
+        and existence checks reuse the counts instead of issuing their own.
+        If the counts cannot be loaded, nothing is skipped.
+        
+        Args:
+            labels: Node labels to count
+            rel_types: Relationship types to count
+        """
+        try:
+            self.label_counts = self._run_counts_query(generate_label_counts_query(labels), labels)
+            self.relationship_counts = self._run_counts_query(
+                generate_relationship_counts_query(rel_types), rel_types
+            )
+        except Exception as e:
+            logger.warning("Could not load counts, validating every type: %s", e)
+            self.label_counts = {}
+            self.relationship_counts = {}
     
     def categorize_result(self, populated_count: int, total_count: int) -> PopulationCategory:
         """
-        Categorize a validation result based on population percentage.
+        Categorize a validation result based on population.
+        
+        Compares the counts directly rather than computing a percentage;
+        every PropertyValidationResult gets its category from here.
         
         Args:
             populated_count: Number of entities with property populated
@@ -53,22 +208,103 @@ class PropertyValidator:
         Returns:
             PopulationCategory (FULL, PARTIAL, or EMPTY)
         """
-        if total_count == 0:
+        # populated_count == 0 also covers total_count == 0
+        if populated_count == 0:
             return PopulationCategory.EMPTY
+        if populated_count == total_count:
+            return PopulationCategory.FULL
+        return PopulationCategory.PARTIAL
+    
+    def _property_result(
+        self,
+        property_name: str,
+        entity_or_rel_type: str,
+        total: int,
+        populated: int,
+        percentage: float,
+        sampled: bool,
+        is_required: bool
+    ) -> PropertyValidationResult:
+        """Build a PropertyValidationResult from the counts and percentage a bulk query returned."""
+        return PropertyValidationResult(
+            property_name=property_name,
+            entity_or_rel_type=entity_or_rel_type,
+            total_count=total,
+            populated_count=populated,
+            empty_count=total - populated,
+            population_percentage=percentage,
+            category=self.categorize_result(populated, total),
+            is_required=is_required,
+            sampled=sampled
+        )
+    
+    def _run_bulk_property_query(
+        self,
+        query: str,
+        property_names: List[str],
+        **parameters: Any
+    ) -> Dict[str, Tuple[int, int, float]]:
+        """
+        Run a bulk property query and index its rows by property name.
         
-        percentage = (populated_count / total_count) * 100
+        Returns:
+            Dictionary mapping property name to (total, populated, percentage);
+            properties missing from the result (e.g., label has no nodes) are absent
+        """
+        return {
+            record["prop_name"]: (record["total"], record["populated"], record["percentage"])
+            for record in self._run(query, props=property_names, **parameters)
+        }
+    
+    def _property_limit(self, is_required: bool) -> Optional[int]:
+        """Number of nodes/relationships a property is counted over, or None for all."""
+        limit = self.row_cap
+        if self.fast_mode and not is_required:
+            limit = FAST_MODE_SAMPLE_SIZE if limit is None else min(limit, FAST_MODE_SAMPLE_SIZE)
+        return limit
+    
+    def _count_properties(
+        self,
+        generate_query: Callable[..., str],
+        type_name: str,
+        properties: List[Tuple[str, bool]]
+    ) -> Dict[str, Tuple[int, int, float, bool]]:
+        """
+        Count property population for one label or relationship type.
         
-        if percentage == 100.0:
-            return PopulationCategory.FULL
-        elif percentage > 0:
-            return PopulationCategory.PARTIAL
-        else:
-            return PopulationCategory.EMPTY
+        Properties are grouped by _property_limit, with one bulk query per group
+        (a single query unless fast mode or a row cap is set).
+        
+        Args:
+            generate_query: Bulk query generator for nodes or relationships
+            type_name: Label or relationship type
+            properties: (property name, is_required) pairs
+            
+        Returns:
+            Dictionary mapping property name to (total, populated, percentage, sampled);
+            sampled is True when the limit stopped the count short of every instance
+        """
+        names_by_limit: Dict[Optional[int], List[str]] = {}
+        for name, is_required in properties:
+            names_by_limit.setdefault(self._property_limit(is_required), []).append(name)
+        
+        counts = {}
+        for limit, names in names_by_limit.items():
+            if limit is None:
+                rows = self._run_bulk_property_query(generate_query(type_name), names)
+            else:
+                rows = self._run_bulk_property_query(generate_query(type_name, sampled=True), names, limit=limit)
+            for name, (total, populated, percentage) in rows.items():
+                counts[name] = (total, populated, percentage, limit is not None and total >= limit)
+        return counts
     
     def validate_entity(self, entity_name: str, metadata: EntityMetadata) -> List[PropertyValidationResult]:
         """
         Validate all properties for a specific entity type.
         
+        All properties are checked with a single query over the label, or one
+        per sample size when fast mode or a row cap is set.
+        
         Args:
             entity_name: The name of the entity (e.g., "Person")
             metadata: Metadata about the entity's properties
@@ -76,57 +312,40 @@ class PropertyValidator:
         Returns:
             List of PropertyValidationResult objects
         """
-        results = []
+        if not metadata.properties:
+            return []
         
-        for prop in metadata.properties:
-            query = generate_node_property_query(entity_name, prop.name)
-            
-            try:
-                result = self.session.run(query)
-                record = result.single()
-                
-                if record:
-                    total = record["total"]
-                    populated = record["populated"]
-                    empty = record["empty"]
-                    
-                    if total > 0:
-                        percentage = (populated / total) * 100
-                    else:
-                        percentage = 0.0
-                    
-                    category = self.categorize_result(populated, total)
-                    
-                    results.append(PropertyValidationResult(
-                        property_name=prop.name,
-                        entity_or_rel_type=entity_name,
-                        total_count=total,
-                        populated_count=populated,
-                        empty_count=empty,
-                        population_percentage=percentage,
-                        category=category,
-                        is_required=not prop.is_optional
-                    ))
-            except Exception as e:
-                print(f"Error validating {entity_name}.{prop.name}: {e}")
-                # Create a failed result
-                results.append(PropertyValidationResult(
-                    property_name=prop.name,
-                    entity_or_rel_type=entity_name,
-                    total_count=0,
-                    populated_count=0,
-                    empty_count=0,
-                    population_percentage=0.0,
-                    category=PopulationCategory.EMPTY,
-                    is_required=not prop.is_optional
-                ))
-        
-        return results
+        try:
+            # No nodes: every property is empty, no need to scan
+            if self.label_counts.get(entity_name) == 0:
+                counts = {}
+            else:
+                counts = self._count_properties(
+                    generate_node_properties_bulk_query,
+                    entity_name,
+                    [(prop.name, not prop.is_optional) for prop in metadata.properties]
+                )
+        except Exception as e:
+            logger.error("Error validating %s properties: %s", entity_name, e)
+            # Failed query: every property is reported as empty
+            counts = {}
+        
+        return [
+            self._property_result(
+                prop.name,
+                entity_name,
+                *counts.get(prop.name, _NO_COUNTS),
+                is_required=not prop.is_optional
+            )
+            for prop in metadata.properties
+        ]
     
     def validate_relationship(self, rel_type: str, properties: List[str]) -> List[PropertyValidationResult]:
         """
         Validate all properties for a specific relationship type.
         
+        All properties are checked with a single query over the type.
+        
         Args:
             rel_type: The relationship type (e.g., "COLLABORATOR")
             properties: List of property names to validate
@@ -134,51 +353,31 @@ class PropertyValidator:
         Returns:
             List of PropertyValidationResult objects
         """
-        results = []
+        if not properties:
+            return []
         
-        for prop_name in properties:
-            query = generate_relationship_property_query(rel_type, prop_name)
-            
-            try:
-                result = self.session.run(query)
-                record = result.single()
-                
-                if record:
-                    total = record["total"]
-                    populated = record["populated"]
-                    empty = record["empty"]
-                    
-                    if total > 0:
-                        percentage = (populated / total) * 100
-                    else:
-                        percentage = 0.0
-                    
-                    category = self.categorize_result(populated, total)
-                    
-                    results.append(PropertyValidationResult(
-                        property_name=prop_name,
-                        entity_or_rel_type=rel_type,
-                        total_count=total,
-                        populated_count=populated,
-                        empty_count=empty,
-                        population_percentage=percentage,
-                        category=category,
-                        is_required=False  # All relationship properties treated as optional
-                    ))
-            except Exception as e:
-                print(f"Error validating relationship {rel_type}.{prop_name}: {e}")
-                results.append(PropertyValidationResult(
-                    property_name=prop_name,
-                    entity_or_rel_type=rel_type,
-                    total_count=0,
-                    populated_count=0,
-                    empty_count=0,
-                    population_percentage=0.0,
-                    category=PopulationCategory.EMPTY,
-                    is_required=False
-                ))
-        
-        return results
+        try:
+            if self.relationship_counts.get(rel_type) == 0:
+                counts = {}
+            else:
+                counts = self._count_properties(
+                    generate_relationship_properties_bulk_query,
+                    rel_type,
+                    [(prop_name, False) for prop_name in properties]
+                )
+        except Exception as e:
+            logger.error("Error validating relationship %s properties: %s", rel_type, e)
+            counts = {}
+        
+        return [
+            self._property_result(
+                prop_name,
+                rel_type,
+                *counts.get(prop_name, _NO_COUNTS),
+                is_required=False  # All relationship properties treated as optional
+            )
+            for prop_name in properties
+        ]
     
     def validate_relationship_existence(self, rel_type: str, has_properties: bool) -> RelationshipExistenceResult:
         """
@@ -198,16 +397,17 @@ class PropertyValidator:
         """
         
         try:
-            result = self.session.run(count_query)
-            record = result.single()
-            total_count = record["count"] if record else 0
+            if rel_type in self.relationship_counts:
+                total_count = self.relationship_counts[rel_type]
+            else:
+                records = self._run(count_query)
+                total_count = records[0]["count"] if records else 0
         except Exception as e:
-            print(f"  Warning: Could not count {rel_type}: {e}")
+            logger.warning("Could not count %s: %s", rel_type, e)
             total_count = 0
         
-        # Check if this relationship is expected (defined in code)
-        all_expected = get_all_relationship_names()
-        is_expected = rel_type in all_expected
+        # Check if this relationship is expected (defined in code); a cached frozenset
+        is_expected = rel_type in get_all_relationship_names()
         
         # Check bidirectional info
         is_bidir = is_bidirectional(rel_type)
@@ -225,9 +425,11 @@ class PropertyValidator:
             RETURN count(r) as count
             """
             try:
-                result = self.session.run(reverse_query)
-                record = result.single()
-                reverse_count = record["count"] if record else 0
+                if reverse_rel in self.relationship_counts:
+                    reverse_count = self.relationship_counts[reverse_rel]
+                else:
+                    records = self._run(reverse_query)
+                    reverse_count = records[0]["count"] if records else 0
                 count_discrepancy = abs(total_count - reverse_count)
             except Exception:
                 reverse_count = 0
@@ -257,81 +459,97 @@ class PropertyValidator:
         """
         expected_rels = get_all_relationship_names()
         discovered_set = set(discovered_rels)
-        expected_set = set(expected_rels)
         
-        missing = list(expected_set - discovered_set)
-        unexpected = list(discovered_set - expected_set)
+        missing = sorted(expected_rels - discovered_set)
+        unexpected = sorted(discovered_set - expected_rels)
         
-        # Check for bidirectional mismatches
-        mismatches = []
-        for rel_type in discovered_rels:
-            if is_bidirectional(rel_type):
-                reverse_rel = get_relationship_pair(rel_type)
-                if reverse_rel and reverse_rel != rel_type:
-                    # Different-name bidirectional - check if reverse exists
-                    if reverse_rel not in discovered_set:
-                        mismatches.append(f"{rel_type} exists but reverse {reverse_rel} is missing")
+        # Different-name bidirectional types whose reverse was not discovered
+        mismatches = [
+            f"{rel_type} exists but reverse {DIFFERENT_NAME_REVERSES[rel_type]} is missing"
+            for rel_type in sorted(DIFFERENT_NAME_REVERSES.keys() & discovered_set)
+            if DIFFERENT_NAME_REVERSES[rel_type] not in discovered_set
+        ]
         
         return RelationshipCoverageResult(
             expected_count=len(expected_rels),
             discovered_count=len(discovered_rels),
-            missing_relationships=sorted(missing),
-            unexpected_relationships=sorted(unexpected),
-            bidirectional_mismatches=mismatches
+            missing_relationships=tuple(missing),
+            unexpected_relationships=tuple(unexpected),
+            bidirectional_mismatches=tuple(mismatches)
         )
     
-    def validate_all(self) -> ValidationReport:
+    def validate_all(self, relationship_metadata: Optional[Dict[str, List[str]]] = None) -> ValidationReport:
         """
         Validate all entities and relationships.
         
+        Args:
+            relationship_metadata: Optional pre-discovered relationship types and
+                                   properties (e.g., the discovered_relationships fixture);
+                                   discovered through the driver when omitted
+        
         Returns:
             ValidationReport containing all validation results
         """
-        print("Discovering entity types from db/models.py...")
+        logger.info("Discovering entity types from db/models.py...")
         self.entity_metadata = discover_entity_types()
-        print(f"Found {len(self.entity_metadata)} entity types")
+        logger.info("Found %d entity types", len(self.entity_metadata))
+        
+        if relationship_metadata is None:
+            logger.info("Discovering relationship types from Neo4j...")
+            with self.driver.session(database=self.database) as session:
+                relationship_metadata = discover_all_relationships(session)
+        self.relationship_metadata = relationship_metadata
+        logger.info(
+            "Found %d relationship types (including those without properties)", len(self.relationship_metadata)
+        )
         
-        print("\nDiscovering relationship types from Neo4j...")
-        self.relationship_metadata = discover_all_relationships(self.session)
-        print(f"Found {len(self.relationship_metadata)} relationship types (including those without properties)")
+        logger.info("Counting nodes and relationships...")
+        self.load_counts(list(self.entity_metadata.keys()), list(self.relationship_metadata.keys()))
         
         entity_results: Dict[str, List[PropertyValidationResult]] = {}
         relationship_results: Dict[str, List[PropertyValidationResult]] = {}
         relationship_existence: Dict[str, RelationshipExistenceResult] = {}
         
-        # Validate entities
-        print("\nValidating entity properties...")
-        for entity_name, metadata in self.entity_metadata.items():
-            print(f"  Validating {entity_name}...")
-            results = self.validate_entity(entity_name, metadata)
-            entity_results[entity_name] = results
-        
-        # Validate relationships (property population)
-        print("\nValidating relationship properties...")
-        for rel_type, properties in self.relationship_metadata.items():
-            if properties:  # Only validate properties if they exist
-                print(f"  Validating {rel_type} properties...")
-                results = self.validate_relationship(rel_type, properties)
-                relationship_results[rel_type] = results
+        # Entity and relationship types are independent, so validate them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Validate entities
+            logger.info("Validating entity properties...")
+            entity_futures = {}
+            for entity_name, metadata in self.entity_metadata.items():
+                logger.debug("Validating %s...", entity_name)
+                entity_futures[entity_name] = executor.submit(self.validate_entity, entity_name, metadata)
+            
+            # Validate relationships (property population)
+            logger.info("Validating relationship properties...")
+            relationship_futures = {}
+            for rel_type, properties in self.relationship_metadata.items():
+                if properties:  # Only validate properties if they exist
+                    logger.debug("Validating %s properties...", rel_type)
+                    relationship_futures[rel_type] = executor.submit(self.validate_relationship, rel_type, properties)
+            
+            # Collect in submission order so reports are deterministic, counting
+            # failures (required properties with 0% population) as results arrive
+            failure_count = 0
+            for entity_name, future in entity_futures.items():
+                results = entity_results[entity_name] = future.result()
+                failure_count += sum(
+                    1 for result in results
+                    if result.is_required and result.category == PopulationCategory.EMPTY
+                )
+            for rel_type, future in relationship_futures.items():
+                relationship_results[rel_type] = future.result()
         
         # Validate relationship existence and consistency
-        print("\nValidating relationship existence and consistency...")
+        logger.info("Validating relationship existence and consistency...")
         for rel_type, properties in self.relationship_metadata.items():
-            print(f"  Checking {rel_type}...")
+            logger.debug("Checking %s...", rel_type)
             existence_result = self.validate_relationship_existence(rel_type, len(properties) > 0)
             relationship_existence[rel_type] = existence_result
         
         # Validate relationship coverage
-        print("\nValidating relationship coverage against expected definitions...")
+        logger.info("Validating relationship coverage against expected definitions...")
         coverage = self.validate_relationship_coverage(list(self.relationship_metadata.keys()))
         
-        # Count failures (required properties with 0% population)
-        failure_count = 0
-        for results in entity_results.values():
-            for result in results:
-                if result.is_required and result.category == PopulationCategory.EMPTY:
-                    failure_count += 1
-        
         return ValidationReport(
             timestamp=datetime.now(),
             entity_results=entity_results,
@@ -344,20 +562,17 @@ class PropertyValidator:
 
 if __name__ == "__main__":
     # Test validation
-    import os
-    from neo4j import GraphDatabase
+    from tests.property_validation.connection import build_driver
     
-    uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
-    username = os.getenv('NEO4J_USERNAME', 'neo4j')
-    password = os.getenv('NEO4J_PASSWORD', 'password')
+    _configure_logging()
     
-    driver = GraphDatabase.driver(uri, auth=(username, password))
+    driver = build_driver()
     
     try:
-        with driver.session() as session:
-            validator = PropertyValidator(session)
-            report = validator.validate_all()
-            print(f"\nValidation complete!")
-            print(f"Failures: {report.failure_count}")
+        validator = PropertyValidator(driver)
+        # Discovers relationships with discover_all_relationships, as the pytest fixtures do
+        report = validator.validate_all()
+        print(f"\nValidation complete!")
+        print(f"Failures: {report.failure_count}")
     finally:
         driver.close()
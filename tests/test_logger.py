@@ -17,30 +17,36 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from common.logger import logger, LogContext
 
+BANNER = "=" * 70
+
+
+def print_banner(title: str) -> None:
+    """Print a test title between banner lines in a single write."""
+    sys.stdout.write(f"{BANNER}\n{title}\n{BANNER}\n")
+
 
 @pytest.fixture(scope="session", autouse=True)
 def display_test_config():
     """Display test configuration at the start of the test session."""
-    print("\n" + "=" * 70)
-    print("LOGGER TEST SUITE CONFIGURATION")
-    print("=" * 70)
-    print(f"LOG_FORMAT: {os.getenv('LOG_FORMAT', 'JSON')}")
-    print(f"LOG_LEVEL: {os.getenv('LOG_LEVEL', 'INFO')}")
-    print("")
-    print("Run with different configurations:")
-    print("  LOG_FORMAT=TEXT pytest tests/test_logger.py -v -s")
-    print("  LOG_FORMAT=JSON pytest tests/test_logger.py -v -s")
-    print("  LOG_LEVEL=DEBUG pytest tests/test_logger.py -v -s")
-    print("  LOG_LEVEL=WARNING pytest tests/test_logger.py -v -s")
-    print("=" * 70)
-    print()
+    sys.stdout.write(
+        f"\n{BANNER}\n"
+        "LOGGER TEST SUITE CONFIGURATION\n"
+        f"{BANNER}\n"
+        f"LOG_FORMAT: {os.getenv('LOG_FORMAT', 'JSON')}\n"
+        f"LOG_LEVEL: {os.getenv('LOG_LEVEL', 'INFO')}\n"
+        "\n"
+        "Run with different configurations:\n"
+        "  LOG_FORMAT=TEXT pytest tests/test_logger.py -v -s\n"
+        "  LOG_FORMAT=JSON pytest tests/test_logger.py -v -s\n"
+        "  LOG_LEVEL=DEBUG pytest tests/test_logger.py -v -s\n"
+        "  LOG_LEVEL=WARNING pytest tests/test_logger.py -v -s\n"
+        f"{BANNER}\n\n"
+    )
 
 
 def test_basic_log_levels(caplog):
     """Test all log levels without context."""
-    print("=" * 70)
-    print("TEST 1: Basic Log Levels (No Context)")
-    print("=" * 70)
+    print_banner("TEST 1: Basic Log Levels (No Context)")
     
     logger.debug("This is a DEBUG message - detailed diagnostic info")
     logger.info("This is an INFO message - general information")
@@ -56,9 +62,7 @@ def test_basic_log_levels(caplog):
 
 def test_logs_with_context(caplog):
     """Test logging with LogContext."""
-    print("=" * 70)
-    print("TEST 2: Logs with LogContext")
-    print("=" * 70)
+    print_banner("TEST 2: Logs with LogContext")
     
     with LogContext(project_id="proj-123", user_id="alice", request_id="req-abc-456"):
         logger.info("Processing user request")
@@ -74,9 +78,7 @@ def test_logs_with_context(caplog):
 
 def test_nested_contexts(caplog):
     """Test nested LogContext usage."""
-    print("=" * 70)
-    print("TEST 3: Nested LogContext")
-    print("=" * 70)
+    print_banner("TEST 3: Nested LogContext")
     
     with LogContext(project_id="proj-999"):
         logger.info("Outer context - project level")
@@ -95,9 +97,7 @@ def test_nested_contexts(caplog):
 
 def test_partial_context(caplog):
     """Test LogContext with only some fields set."""
-    print("=" * 70)
-    print("TEST 4: Partial LogContext (only request_id)")
-    print("=" * 70)
+    print_banner("TEST 4: Partial LogContext (only request_id)")
     
     with LogContext(request_id="req-partial-123"):
         logger.info("Only request_id is set in context")
@@ -111,9 +111,7 @@ def test_partial_context(caplog):
 
 def test_exception_logging(caplog):
     """Test exception logging with logger.exception()."""
-    print("=" * 70)
-    print("TEST 5: Exception Logging")
-    print("=" * 70)
+    print_banner("TEST 5: Exception Logging")
     
     try:
         result = 10 / 0
@@ -129,9 +127,7 @@ def test_exception_logging(caplog):
 
 def test_exception_with_context(caplog):
     """Test exception logging with LogContext."""
-    print("=" * 70)
-    print("TEST 6: Exception with LogContext")
-    print("=" * 70)
+    print_banner("TEST 6: Exception with LogContext")
     
     with LogContext(project_id="proj-error", user_id="charlie", request_id="req-err-001"):
         try:
@@ -148,9 +144,7 @@ def test_exception_with_context(caplog):
 
 def test_error_method_with_exception(caplog):
     """Test logger.error() with exception object."""
-    print("=" * 70)
-    print("TEST 7: logger.error() with Exception Object")
-    print("=" * 70)
+    print_banner("TEST 7: logger.error() with Exception Object")
     
     with LogContext(project_id="proj-custom", request_id="req-custom-999"):
         try:
@@ -168,9 +162,7 @@ def test_error_method_with_exception(caplog):
 
 def test_multi_line_messages(caplog):
     """Test logging with multi-line messages."""
-    print("=" * 70)
-    print("TEST 8: Multi-line Messages")
-    print("=" * 70)
+    print_banner("TEST 8: Multi-line Messages")
     
     with LogContext(project_id="proj-multiline"):
         long_message = """
@@ -190,9 +182,7 @@ def test_multi_line_messages(caplog):
 
 def test_complex_scenario(caplog):
     """Test a complex real-world scenario."""
-    print("=" * 70)
-    print("TEST 9: Complex Real-World Scenario")
-    print("=" * 70)
+    print_banner("TEST 9: Complex Real-World Scenario")
     
     with LogContext(project_id="github-sync", user_id="system"):
         logger.info("Starting GitHub repository sync")
@@ -219,9 +209,7 @@ def test_complex_scenario(caplog):
 
 def test_no_context(caplog):
     """Test logging without any context."""
-    print("=" * 70)
-    print("TEST 10: Logs Without Context (Baseline)")
-    print("=" * 70)
+    print_banner("TEST 10: Logs Without Context (Baseline)")
     
     logger.info("This log has no context variables")
     logger.debug("Debugging without context")